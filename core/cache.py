@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+DonkeyKong Disk Cache
+Persistent, content-addressed cache for expensive external calls (fetches, validations)
+"""
+
+import gzip
+import hashlib
+import os
+import tempfile
+import time
+from typing import Any
+
+from . import serialization
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'DONKEYKONG_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'donkeykong')
+)
+
+
+class DiskCache:
+    """
+    Directory of gzipped JSON entries, one file per SHA-256 key.
+
+    Entries expire `ttl` seconds after they were written. Bump `version`
+    whenever the shape of cached values changes - old entries then simply
+    stop matching. Writes are atomic, so concurrent workers can share a
+    directory.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, ttl: float = 7 * 86400,
+                 version: str = 'v1'):
+        self.directory = directory
+        self.ttl = ttl
+        self.version = version
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, *parts: str) -> str:
+        """Hash identifying parts (plus the cache version) into a key"""
+        return hashlib.sha256('|'.join((*parts, self.version)).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json.gz')
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return default
+            with gzip.open(path, 'rb') as f:
+                return serialization.loads(f.read())
+        except (OSError, ValueError):
+            # Missing, truncated or corrupt entry - treat as a miss
+            return default
+
+    def set(self, key: str, value: Any):
+        """Store value (must be JSON-serializable) under key"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(serialization.dumps(value))
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
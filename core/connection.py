@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+DonkeyKong Redis Connections
+Pooled clients with keepalive so workers and monitors reuse warm sockets
+"""
+
+import socket
+
+import redis
+import redis.asyncio
+
+# Probe idle connections after 60s instead of the OS default (often 2h)
+_KEEPALIVE_OPTIONS = {socket.TCP_KEEPIDLE: 60} if hasattr(socket, 'TCP_KEEPIDLE') else {}
+
+_POOL_OPTIONS = {
+    'decode_responses': True,
+    'socket_keepalive': True,
+    'socket_keepalive_options': _KEEPALIVE_OPTIONS,
+    'health_check_interval': 30,
+}
+
+
+def connect(url: str, max_connections: int = 8) -> redis.Redis:
+    """
+    Create a Redis client backed by a bounded, blocking connection pool.
+
+    Callers beyond max_connections wait for a free connection instead of
+    opening (and later tearing down) extra sockets.
+
+    Args:
+        url: Redis URL (redis://, rediss://, unix://)
+        max_connections: Pool size - match it to the caller's concurrency
+
+    Returns:
+        Redis client that decodes replies to str
+    """
+    pool = redis.BlockingConnectionPool.from_url(
+        url, max_connections=max_connections, **_POOL_OPTIONS
+    )
+    return redis.Redis(connection_pool=pool)
+
+
+def connect_async(url: str, max_connections: int = 8) -> redis.asyncio.Redis:
+    """asyncio counterpart of connect()"""
+    pool = redis.asyncio.BlockingConnectionPool.from_url(
+        url, max_connections=max_connections, **_POOL_OPTIONS
+    )
+    return redis.asyncio.Redis(connection_pool=pool)
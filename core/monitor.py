@@ -6,12 +6,45 @@ Real-time monitoring and reporting for distributed collection
 
 import os
 import json
-import redis
 import time
 from datetime import datetime
 from typing import Dict, Optional
 from dataclasses import dataclass
 
+from . import connection, serialization
+from .worker import FAILURES_RECENT_KEY, PROGRESS_KEY
+
+
+_SEPARATOR = '=' * 50
+
+_STATUS_ICON = {'running': '🟢', 'completed': '✅'}
+
+# Report layout is fixed - build the templates once, interpolate per report
+_REPORT_HEADER = """
+🦍 DONKEYKONG PROGRESS REPORT
+""" + _SEPARATOR + """
+📅 Milestone: {milestone} Entities Processed
+⏰ Time: {time}
+
+OVERALL STATISTICS:
+-------------------
+✅ Total Processed: {total_processed}
+✅ Total Successful: {total_successful} ({success_rate:.1f}%)
+❌ Total Failed: {total_failed}
+⏱️ Elapsed Time: {elapsed_minutes:.1f} minutes
+⏱️ Avg Time/Entity: {avg_time:.1f} seconds
+
+WORKER STATUS:
+--------------
+🔧 Active Workers: {active_workers}/{expected_workers}
+"""
+
+_REPORT_FOOTER = """
+
+SYSTEM HEALTH: {health}
+""" + _SEPARATOR + """
+"""
+
 
 @dataclass
 class MonitorConfig:
@@ -20,6 +53,7 @@ class MonitorConfig:
     report_dir: str = "/reports"
     report_interval: int = 100  # Report every N entities
     expected_workers: int = 10
+    heartbeat_interval: int = 60  # Seconds between status lines
 
 
 class DonkeyMonitor:
@@ -34,33 +68,28 @@ class DonkeyMonitor:
         
         os.makedirs(self.config.report_dir, exist_ok=True)
         
-        self.redis = redis.from_url(self.config.redis_url)
+        self.redis = connection.connect(self.config.redis_url)
         self.start_time = datetime.now()
         self.last_report_count = 0
     
     def get_global_stats(self) -> Dict:
         """Get aggregated stats from all workers"""
-        progress = self.redis.hgetall('collection:progress')
-        
-        # Handle bytes from Redis
-        def decode(val):
-            if isinstance(val, bytes):
-                return val.decode()
-            return val
-        
-        total_processed = int(decode(progress.get(b'total_processed', 0)) or 0)
-        total_successful = int(decode(progress.get(b'total_successful', 0)) or 0)
-        total_failed = int(decode(progress.get(b'total_failed', 0)) or 0)
-        
-        # Get individual worker stats
-        worker_stats = {}
-        for i in range(1, self.config.expected_workers + 1):
-            worker_key = f'worker:{i}:stats'
-            stats = self.redis.hgetall(worker_key)
-            if stats:
-                worker_stats[i] = {
-                    decode(k): decode(v) for k, v in stats.items()
-                }
+        # Queue progress + every worker hash and fetch them in one round trip
+        worker_ids = range(1, self.config.expected_workers + 1)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(PROGRESS_KEY)
+        for i in worker_ids:
+            pipe.hgetall(f'worker:{i}:stats')
+        progress, *all_worker_stats = pipe.execute()
+        
+        total_processed = int(progress.get('total_processed', 0) or 0)
+        total_successful = int(progress.get('total_successful', 0) or 0)
+        total_failed = int(progress.get('total_failed', 0) or 0)
+        
+        # Individual worker stats - replies are already str, use the hashes as-is
+        worker_stats = {
+            i: stats for i, stats in zip(worker_ids, all_worker_stats) if stats
+        }
         
         return {
             'total_processed': total_processed,
@@ -70,29 +99,44 @@ class DonkeyMonitor:
         }
     
     def get_failures(self, limit: int = 20) -> list:
-        """Get recent failures"""
+        """Get recent failures, newest first"""
         failures = []
         
-        for key in self.redis.scan_iter('failures:*'):
-            failure_data = self.redis.hgetall(key)
-            entity = key.decode().split(':')[1] if isinstance(key, bytes) else key.split(':')[1]
+        # Workers keep a capped index of recent failures - read it a page at a
+        # time (no SCAN), until limit records are found or the index runs out
+        start = 0
+        while len(failures) < limit:
+            entities = self.redis.lrange(FAILURES_RECENT_KEY, start, start + limit - 1)
+            if not entities:
+                break
+            start += len(entities)
             
-            failures.append({
-                'entity': entity,
-                'error': failure_data.get(b'error', b'').decode() if b'error' in failure_data else '',
-                'worker_id': failure_data.get(b'worker_id', b'').decode() if b'worker_id' in failure_data else '',
-                'timestamp': failure_data.get(b'timestamp', b'').decode() if b'timestamp' in failure_data else ''
-            })
+            pipe = self.redis.pipeline(transaction=False)
+            for entity in entities:
+                pipe.hgetall(f'failures:{entity}')
             
-            if len(failures) >= limit:
-                break
+            for entity, failure_data in zip(entities, pipe.execute()):
+                # Record cleared (e.g. queued for retry) since it was indexed
+                if not failure_data:
+                    continue
+                
+                failures.append({
+                    'entity': entity,
+                    'error': failure_data.get('error', ''),
+                    'worker_id': failure_data.get('worker_id', ''),
+                    'timestamp': failure_data.get('timestamp', '')
+                })
+                if len(failures) == limit:
+                    break
         
         return failures
     
-    def create_progress_report(self, milestone: int) -> str:
-        """Create detailed progress report"""
-        stats = self.get_global_stats()
-        elapsed_time = (datetime.now() - self.start_time).total_seconds()
+    def create_progress_report(self, milestone: int, stats: Optional[Dict] = None) -> str:
+        """Create detailed progress report (from stats if already fetched this tick)"""
+        if stats is None:
+            stats = self.get_global_stats()
+        now = datetime.now()
+        elapsed_time = (now - self.start_time).total_seconds()
         
         # Calculate metrics
         processed = max(stats['total_processed'], 1)
@@ -105,46 +149,43 @@ class DonkeyMonitor:
             if w.get('status') == 'running'
         )
         
-        report = f"""
-🦍 DONKEYKONG PROGRESS REPORT
-{'='*50}
-📅 Milestone: {milestone} Entities Processed
-⏰ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-OVERALL STATISTICS:
--------------------
-✅ Total Processed: {stats['total_processed']}
-✅ Total Successful: {stats['total_successful']} ({success_rate:.1f}%)
-❌ Total Failed: {stats['total_failed']}
-⏱️ Elapsed Time: {elapsed_time/60:.1f} minutes
-⏱️ Avg Time/Entity: {avg_time:.1f} seconds
-
-WORKER STATUS:
---------------
-🔧 Active Workers: {active_workers}/{self.config.expected_workers}
-"""
+        header = _REPORT_HEADER.format(
+            milestone=milestone,
+            time=now.strftime('%Y-%m-%d %H:%M:%S'),
+            total_processed=stats['total_processed'],
+            total_successful=stats['total_successful'],
+            success_rate=success_rate,
+            total_failed=stats['total_failed'],
+            elapsed_minutes=elapsed_time / 60,
+            avg_time=avg_time,
+            active_workers=active_workers,
+            expected_workers=self.config.expected_workers
+        )
         
-        # Add worker details
-        for worker_id, worker_data in sorted(stats['worker_stats'].items()):
-            status = worker_data.get('status', 'unknown')
-            processed = worker_data.get('entities_processed', 0)
-            current = worker_data.get('current_entity', '-')
-            
-            status_icon = '🟢' if status == 'running' else '✅' if status == 'completed' else '🔴'
-            report += f"\n  {status_icon} Worker {worker_id}: {processed} processed, Status: {status}"
-            if status == 'running' and current != '-':
-                report += f" (current: {current})"
+        # Worker details, one line each
+        worker_lines = [
+            self._format_worker_line(worker_id, worker_data)
+            for worker_id, worker_data in sorted(stats['worker_stats'].items())
+        ]
         
         # System health
         health = '🟢 HEALTHY' if success_rate >= 80 and active_workers >= self.config.expected_workers * 0.8 else \
                  '🟡 DEGRADED' if success_rate >= 60 else '🔴 CRITICAL'
         
-        report += f"""
-
-SYSTEM HEALTH: {health}
-{'='*50}
-"""
-        return report
+        # Assemble every section in a single join
+        return ''.join([header, *worker_lines, _REPORT_FOOTER.format(health=health)])
+    
+    @staticmethod
+    def _format_worker_line(worker_id: int, worker_data: Dict) -> str:
+        """Format one worker's line of the progress report"""
+        status = worker_data.get('status', 'unknown')
+        processed = worker_data.get('entities_processed', 0)
+        current = worker_data.get('current_entity', '-')
+        
+        line = f"\n  {_STATUS_ICON.get(status, '🔴')} Worker {worker_id}: {processed} processed, Status: {status}"
+        if status == 'running' and current != '-':
+            line += f" (current: {current})"
+        return line
     
     def save_report(self, report: str, milestone: int):
         """Save report to file"""
@@ -155,9 +196,10 @@ SYSTEM HEALTH: {health}
         with open(report_file, 'w') as f:
             f.write(report)
     
-    def check_completion(self) -> bool:
-        """Check if all workers have completed"""
-        stats = self.get_global_stats()
+    def check_completion(self, stats: Optional[Dict] = None) -> bool:
+        """Check if all workers have completed (from stats if already fetched this tick)"""
+        if stats is None:
+            stats = self.get_global_stats()
         
         for worker_data in stats['worker_stats'].values():
             if worker_data.get('status') not in ['completed', 'failed']:
@@ -171,33 +213,61 @@ SYSTEM HEALTH: {health}
         print(f"📊 Will report every {self.config.report_interval} entities processed")
         print("=" * 60)
         
+        # Workers publish to 'progress' as they go - wake on those events
+        # instead of polling Redis on a fixed timer
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe('progress')
+        worker_progress = {}
+        
+        # Monotonic schedule - immune to wall-clock jumps, fires once per interval
+        next_heartbeat = time.monotonic() + self.config.heartbeat_interval
+        
         while True:
             try:
+                message = pubsub.get_message(
+                    timeout=max(0.0, next_heartbeat - time.monotonic())
+                )
+                heartbeat = time.monotonic() >= next_heartbeat
+                if heartbeat:
+                    next_heartbeat += self.config.heartbeat_interval
+                
+                refresh = heartbeat
+                if message is not None:
+                    event = serialization.loads(message['data'])
+                    worker_progress[event['worker_id']] = event['entities_processed']
+                    
+                    # Only hit Redis for full stats at a milestone or a worker finishing
+                    next_milestone = self.last_report_count + self.config.report_interval
+                    refresh = refresh or event.get('status') == 'completed' or \
+                        sum(worker_progress.values()) >= next_milestone
+                
+                if not refresh:
+                    continue
+                
+                # One Redis read per tick, shared by reporting and completion checks
                 stats = self.get_global_stats()
                 total_processed = stats['total_processed']
                 
-                # Check if we need to report
-                if total_processed > 0 and \
-                   total_processed % self.config.report_interval == 0 and \
-                   total_processed > self.last_report_count:
-                    
-                    report = self.create_progress_report(total_processed)
+                # Check if we crossed a report milestone
+                milestone = total_processed - total_processed % self.config.report_interval
+                if milestone > self.last_report_count:
+                    report = self.create_progress_report(milestone, stats)
                     print(report)
-                    self.save_report(report, total_processed)
-                    self.last_report_count = total_processed
+                    self.save_report(report, milestone)
+                    self.last_report_count = milestone
                 
-                # Quick status update every minute
-                if int(time.time()) % 60 == 0:
+                # Quick status update every heartbeat_interval
+                if heartbeat:
                     processed = stats['total_processed']
                     success_rate = (stats['total_successful'] / max(processed, 1)) * 100
-                    print(f"\r⏱️ {datetime.now().strftime('%H:%M:%S')} - "
+                    print(f"\r⏱️ {time.strftime('%H:%M:%S')} - "
                           f"Processed: {processed} ({success_rate:.1f}% success)", 
                           end='', flush=True)
                 
                 # Check completion
-                if self.check_completion():
+                if self.check_completion(stats):
                     print("\n\n✅ ALL WORKERS COMPLETED!")
-                    final_report = self.create_progress_report(total_processed)
+                    final_report = self.create_progress_report(total_processed, stats)
                     print(final_report)
                     
                     # Save final report
@@ -207,18 +277,19 @@ SYSTEM HEALTH: {health}
                     
                     break
                 
-                time.sleep(5)
-                
             except KeyboardInterrupt:
                 print("\n\n⚠️ Monitor stopped by user")
                 break
             except Exception as e:
                 print(f"\n❌ Monitor error: {e}")
                 time.sleep(10)
+        
+        pubsub.close()
     
-    def get_status_json(self) -> Dict:
+    def get_status_json(self, stats: Optional[Dict] = None) -> Dict:
         """Get current status as JSON (for MCP/API)"""
-        stats = self.get_global_stats()
+        if stats is None:
+            stats = self.get_global_stats()
         elapsed = (datetime.now() - self.start_time).total_seconds()
         processed = max(stats['total_processed'], 1)
         
@@ -234,7 +305,7 @@ SYSTEM HEALTH: {health}
                 if w.get('status') == 'running'
             ),
             'total_workers': len(stats['worker_stats']),
-            'is_complete': self.check_completion()
+            'is_complete': self.check_completion(stats)
         }
 
 
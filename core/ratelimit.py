@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+DonkeyKong Rate Limiting
+Monotonic token bucket - only waits for the part of the interval not already spent working
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket allowing one acquisition per `interval` seconds on average.
+
+    Time spent between acquisitions (e.g. a slow collect()) counts towards
+    the interval, and up to `burst` acquisitions can happen back-to-back
+    after idle time. Thread-safe.
+    """
+
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        if self.interval <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) / self.interval)
+            self._last = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens * self.interval)
+
+    def acquire(self):
+        """Block until a token is available"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+DonkeyKong Serialization
+Fast JSON encoding for hot paths - uses orjson when installed, stdlib json otherwise
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, default: Optional[Callable] = str, indent: bool = False) -> bytes:
+    """
+    Serialize obj to compact JSON bytes.
+
+    Args:
+        obj: The object to serialize
+        default: Called for objects JSON can't represent (stringified by default)
+        indent: Pretty-print with 2-space indentation (for files people read)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits - let stdlib json handle it
+            pass
+    if indent:
+        return json.dumps(obj, default=default, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, default=default, separators=(',', ':')).encode()
+
+
+def preview(obj: Any, limit: int) -> str:
+    """
+    Compact JSON of obj cut to at most limit bytes, as text (for prompts and logs).
+
+    A multi-byte character split by the cut is dropped.
+    """
+    return dumps(obj)[:limit].decode('utf-8', 'ignore')
+
+
+def loads(data: Any) -> Any:
+    """Deserialize JSON from str or bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,16 +5,30 @@ Base class for distributed data collection with local LLM validation
 """
 
 import os
-import json
+import sys
 import time
+import queue
+import asyncio
 import redis
 import logging
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 
-logger = logging.getLogger(__name__)
+from . import connection, serialization
+from .ratelimit import TokenBucket
+
+# Redis hash of job-wide counters: total_processed, total_successful, total_failed.
+# Workers bump the fields with HINCRBY inside their per-entity pipelines, so
+# readers get a consistent snapshot with a single HGETALL (pipelineable).
+PROGRESS_KEY = 'collection:progress'
+
+# Redis list of recently failed entities (newest first), capped in length.
+# Kept outside the failures:* namespace that per-entity hashes live in.
+FAILURES_RECENT_KEY = 'collection:failures'
+FAILURES_RECENT_MAX = 1000
 
 
 @dataclass
@@ -23,11 +37,15 @@ class WorkerConfig:
     worker_id: int = 1
     start_index: int = 0
     end_index: int = 100
+    entities_file: str = ""  # this worker's own partition; read whole instead of slicing
     redis_url: str = "redis://localhost:6379"
     data_dir: str = "/data"
     backup_dir: str = "/backups"
     log_dir: str = "/logs"
     rate_limit: float = 2.0  # seconds between entities
+    rate_burst: int = 1  # entities allowed back-to-back after a slow stretch
+    concurrency: int = 1  # entities collected at once (shares the rate limit)
+    batch_size: int = 1  # entities per collect_batch() call (one rate-limit slot per batch)
     checkpoint_interval: int = 10
     retry_attempts: int = 3
     
@@ -53,14 +71,22 @@ class DonkeyWorker(ABC):
     - validate(entity, data) -> validation result (optional, uses Kong if not implemented)
     """
     
+    # Monotonic stats pushed to Redis as HINCRBY deltas
+    COUNTER_FIELDS = ('entities_processed', 'entities_successful', 'entities_failed')
+    
     def __init__(self, config: Optional[WorkerConfig] = None):
         self.config = config or WorkerConfig(
             worker_id=int(os.environ.get('WORKER_ID', 1)),
             start_index=int(os.environ.get('START_INDEX', 0)),
             end_index=int(os.environ.get('END_INDEX', 100)),
+            entities_file=os.environ.get('ENTITIES_FILE', ''),
             redis_url=os.environ.get('REDIS_URL', 'redis://localhost:6379'),
             data_dir=os.environ.get('DATA_DIR', '/data'),
+            backup_dir=os.environ.get('BACKUP_DIR', '/backups'),
+            log_dir=os.environ.get('LOG_DIR', '/logs'),
             rate_limit=float(os.environ.get('RATE_LIMIT', 2.0)),
+            concurrency=int(os.environ.get('CONCURRENCY', 1)),
+            batch_size=int(os.environ.get('BATCH_SIZE', 1)),
         )
         
         # Create directories
@@ -68,8 +94,8 @@ class DonkeyWorker(ABC):
         os.makedirs(self.config.backup_dir, exist_ok=True)
         os.makedirs(self.config.log_dir, exist_ok=True)
         
-        # Initialize Redis
-        self.redis = redis.from_url(self.config.redis_url)
+        # Initialize Redis (pooled, keepalive sockets sized to our concurrency)
+        self.redis = connection.connect(self.config.redis_url, self._pool_size())
         
         # Kong validator (set by Pipeline or manually)
         self.kong = None
@@ -85,8 +111,29 @@ class DonkeyWorker(ABC):
             'status': 'initialized'
         }
         
+        # Shared rate limit - run_async takes one slot per batch; collect_batch()
+        # overrides that make further requests acquire() a slot for each
+        self.limiter = TokenBucket(self.config.rate_limit, self.config.rate_burst)
+        
+        # Last stats written to Redis, so updates only send what changed
+        self._pushed_stats: Dict[str, Any] = {}
+        
+        # entities_processed at the last checkpoint written
+        self._checkpointed_at: Optional[int] = None
+        
         # Setup logging
         self._setup_logging()
+        
+        # Result files are written by a background thread so disk I/O
+        # overlaps collection instead of blocking the worker loop
+        # (started with the first result, stopped by close())
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+    
+    def _pool_size(self) -> int:
+        """Redis connections needed: one per in-flight entity plus headroom for stats"""
+        return max(2, self.config.concurrency * 2)
     
     def _setup_logging(self):
         """Setup worker-specific logging"""
@@ -95,19 +142,28 @@ class DonkeyWorker(ABC):
             f'worker_{self.config.worker_id}.log'
         )
         
-        handler = logging.FileHandler(log_file)
-        handler.setFormatter(logging.Formatter(
-            f'[%(asctime)s] Worker {self.config.worker_id}: %(message)s'
-        ))
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+        # One formatter for file and console - the timestamp is rendered once per record
+        formatter = logging.Formatter(
+            f'[%(asctime)s] Worker {self.config.worker_id}: %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        
+        # Per-worker logger - workers sharing a process (threads, repeated instances)
+        # must not stack handlers on one logger and print every line N times
+        self.logger = logging.getLogger(f'{__name__}.{self.config.worker_id}')
+        for handler in self.logger.handlers[:]:
+            # Left by an earlier instance with this worker id
+            self.logger.removeHandler(handler)
+            handler.close()
+        
+        for handler in (logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)):
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+        self.logger.setLevel(logging.INFO)
     
     def log(self, message: str):
-        """Log message to file and console"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_entry = f"[{timestamp}] Worker {self.config.worker_id}: {message}"
-        print(log_entry)
-        logger.info(message)
+        """Log message to file and console (kept for subclasses - same as self.logger.info)"""
+        self.logger.info(message)
     
     @abstractmethod
     def collect(self, entity: str) -> Dict[str, Any]:
@@ -147,13 +203,33 @@ class DonkeyWorker(ABC):
             'quality_score': 100.0 if data else 0.0
         }
     
+    async def collect_async(self, entity: str) -> Dict[str, Any]:
+        """
+        Async collection hook used by run_async.
+        
+        Defaults to running collect() in a thread. Override with a native
+        coroutine (aiohttp etc.) to avoid the thread hop.
+        """
+        return await asyncio.to_thread(self.collect, entity)
+    
+    def collect_batch(self, entities: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect several entities at once, keyed by entity.
+        
+        Used by run() when config.batch_size > 1. Defaults to calling
+        collect() per entity - override when the source has a bulk endpoint.
+        Entities left out of the result are collected individually.
+        """
+        return {entity: self.collect(entity) for entity in entities}
+    
+    async def collect_batch_async(self, entities: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Async batch hook used by run_async (runs collect_batch() in a thread)"""
+        return await asyncio.to_thread(self.collect_batch, entities)
+    
     def process_entity(self, entity: str) -> CollectionResult:
         """Process a single entity: collect and validate"""
         start_time = time.time()
-        
-        self.log(f"Processing {entity}")
-        self.stats['current_entity'] = entity
-        self._update_redis_stats()
+        pipe = self._begin_entity(entity, self.redis)
         
         try:
             # Collect data
@@ -162,45 +238,120 @@ class DonkeyWorker(ABC):
             # Validate with Kong or custom validator
             validation = self.validate(entity, data)
             
-            collection_time = time.time() - start_time
+            return self._record_result(entity, data, validation, start_time, pipe)
             
-            result = CollectionResult(
-                entity_id=entity,
-                success=validation.get('valid', False),
-                data=data,
-                quality_score=validation.get('quality_score', 0.0),
-                validation_result=validation,
-                collection_time=collection_time
-            )
+        except Exception as e:
+            return self._record_error(entity, e, start_time, pipe)
+        
+        finally:
+            try:
+                pipe.execute()
+            except redis.RedisError as e:
+                self._stats_write_failed(e)
+    
+    async def process_entity_async(
+        self,
+        entity: str,
+        client,
+        data: Optional[Dict[str, Any]] = None
+    ) -> CollectionResult:
+        """
+        Async variant of process_entity using an asyncio Redis client.
+        
+        Args:
+            entity: Entity identifier
+            client: asyncio Redis client
+            data: Data already collected for entity (e.g. by a batch);
+                collected now if None
+        """
+        start_time = time.time()
+        pipe = self._begin_entity(entity, client)
+        
+        try:
+            if data is None:
+                data = await self.collect_async(entity)
             
-            # Save result
-            self._save_result(entity, result)
+            # Validators are sync (and Kong may be slow) - keep them off the loop
+            validation = await asyncio.to_thread(self.validate, entity, data)
             
-            if result.success:
-                self.stats['entities_successful'] += 1
-                self.log(f"✅ {entity}: Success (Quality: {result.quality_score:.1f}%)")
-                self.redis.hincrby('collection:progress', 'total_successful', 1)
-            else:
-                self.stats['entities_failed'] += 1
-                issues = validation.get('issues', ['Unknown issue'])
-                self.log(f"⚠️ {entity}: Failed validation - {issues}")
-                self.redis.hincrby('collection:progress', 'total_failed', 1)
-                self._record_failure(entity, str(issues))
-            
-            return result
+            return self._record_result(entity, data, validation, start_time, pipe)
             
         except Exception as e:
+            return self._record_error(entity, e, start_time, pipe)
+        
+        finally:
+            try:
+                await pipe.execute()
+            except redis.RedisError as e:
+                self._stats_write_failed(e)
+    
+    def _begin_entity(self, entity: str, client):
+        """Start an entity and return the pipeline its Redis writes are queued on"""
+        # Per-entity chatter is DEBUG with lazy %-args - formatted only if enabled
+        self.logger.debug("Processing %s", entity)
+        self.stats['current_entity'] = entity
+        
+        # Queue every Redis write for this entity, caller flushes once (one RTT)
+        pipe = client.pipeline(transaction=False)
+        self._update_redis_stats(pipe)
+        pipe.hincrby(PROGRESS_KEY, 'total_processed', 1)
+        return pipe
+    
+    def _record_result(
+        self,
+        entity: str,
+        data: Dict[str, Any],
+        validation: Dict[str, Any],
+        start_time: float,
+        pipe
+    ) -> CollectionResult:
+        """Save a validated result and queue its progress updates"""
+        collection_time = time.time() - start_time
+        
+        result = CollectionResult(
+            entity_id=entity,
+            success=validation.get('valid', False),
+            data=data,
+            quality_score=validation.get('quality_score', 0.0),
+            validation_result=validation,
+            collection_time=collection_time
+        )
+        
+        # Save result
+        self._save_result(entity, result)
+        
+        if result.success:
+            self.stats['entities_successful'] += 1
+            self.logger.debug("✅ %s: Success (Quality: %.1f%%)", entity, result.quality_score)
+            pipe.hincrby(PROGRESS_KEY, 'total_successful', 1)
+        else:
             self.stats['entities_failed'] += 1
-            self.log(f"❌ {entity}: Error - {e}")
-            self.redis.hincrby('collection:progress', 'total_failed', 1)
-            self._record_failure(entity, str(e))
-            
-            return CollectionResult(
-                entity_id=entity,
-                success=False,
-                error=str(e),
-                collection_time=time.time() - start_time
-            )
+            issues = validation.get('issues', ['Unknown issue'])
+            self.logger.info("⚠️ %s: Failed validation - %s", entity, issues)
+            pipe.hincrby(PROGRESS_KEY, 'total_failed', 1)
+            self._record_failure(entity, str(issues), pipe)
+        
+        return result
+    
+    def _record_error(
+        self,
+        entity: str,
+        error: Exception,
+        start_time: float,
+        pipe
+    ) -> CollectionResult:
+        """Queue progress updates for an entity whose collection raised"""
+        self.stats['entities_failed'] += 1
+        self.logger.info("❌ %s: Error - %s", entity, error)
+        pipe.hincrby(PROGRESS_KEY, 'total_failed', 1)
+        self._record_failure(entity, str(error), pipe)
+        
+        return CollectionResult(
+            entity_id=entity,
+            success=False,
+            error=str(error),
+            collection_time=time.time() - start_time
+        )
     
     def _save_result(self, entity: str, result: CollectionResult):
         """Save collection result to file"""
@@ -217,36 +368,126 @@ class DonkeyWorker(ABC):
             'timestamp': datetime.now().isoformat()
         }
         
-        with open(filename, 'w') as f:
-            json.dump(output, f, indent=2, default=str)
+        # Compact encoding - per-entity dumps are machine-read, reports are for humans
+        payload = serialization.dumps(output)
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name=f'worker-{self.config.worker_id}-writer',
+                    daemon=True
+                )
+                self._writer.start()
+            self._write_queue.put((filename, payload))
+    
+    def _writer_loop(self):
+        """Write queued result files until a None sentinel arrives"""
+        while True:
+            item = self._write_queue.get()
+            try:
+                if item is None:
+                    return
+                filename, payload = item
+                with open(filename, 'wb') as f:
+                    f.write(payload)
+            except OSError as e:
+                self.logger.error(f"Failed to write {item[0]}: {e}")
+            finally:
+                self._write_queue.task_done()
+    
+    def flush_results(self):
+        """Block until every queued result file has been written"""
+        self._write_queue.join()
+    
+    def close(self):
+        """
+        Write every queued result and stop the writer thread.
+        
+        run() does this itself; call it (or use the worker as a context
+        manager) after driving process_entity() directly. A later result
+        starts a new writer.
+        """
+        with self._writer_lock:
+            if self._writer is None:
+                return
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
     
-    def _record_failure(self, entity: str, error: str):
-        """Record failure details in Redis"""
+    def _record_failure(self, entity: str, error: str, pipe=None):
+        """Record failure details in Redis (queued on pipe if given)"""
         failure_key = f'failures:{entity}'
-        self.redis.hset(failure_key, mapping={
+        client = pipe if pipe is not None else self.redis
+        client.hset(failure_key, mapping={
             'worker_id': str(self.config.worker_id),
             'error': error,
             'timestamp': datetime.now().isoformat()
         })
+        
+        # Capped most-recent-first index, so readers never SCAN the keyspace
+        client.lrem(FAILURES_RECENT_KEY, 0, entity)
+        client.lpush(FAILURES_RECENT_KEY, entity)
+        client.ltrim(FAILURES_RECENT_KEY, 0, FAILURES_RECENT_MAX - 1)
     
-    def _update_redis_stats(self):
-        """Update worker stats in Redis"""
+    def _update_redis_stats(self, pipe=None):
+        """
+        Update worker stats in Redis.
+        
+        If pipe is given the writes are only queued on it and the caller
+        is responsible for executing it; otherwise they are sent at once.
+        """
         try:
+            client = pipe if pipe is not None else self.redis.pipeline(transaction=False)
+            
             worker_key = f'worker:{self.config.worker_id}:stats'
-            self.redis.hset(worker_key, mapping={
-                k: str(v) for k, v in self.stats.items()
-            })
+            if not self._pushed_stats:
+                # First write seeds the whole hash (replacing any previous run's counters)
+                client.hset(worker_key, mapping={
+                    k: str(v) for k, v in self.stats.items()
+                })
+            else:
+                changed = {}
+                for k, v in self.stats.items():
+                    last = self._pushed_stats.get(k)
+                    if v == last:
+                        continue
+                    if k in self.COUNTER_FIELDS:
+                        client.hincrby(worker_key, k, v - last)
+                    else:
+                        changed[k] = str(v)
+                if changed:
+                    client.hset(worker_key, mapping=changed)
+            # Assumed delivered - _stats_write_failed() resets it if the execute fails
+            self._pushed_stats = dict(self.stats)
             
-            # Publish progress event for monitor
-            if self.stats['entities_processed'] % 10 == 0:
-                self.redis.publish('progress', json.dumps({
+            # Publish progress event for monitor (always on the final update
+            # so an event-driven monitor notices completion straight away)
+            if self.stats['entities_processed'] % 10 == 0 or \
+               self.stats['status'] == 'completed':
+                client.publish('progress', serialization.dumps({
                     'worker_id': self.config.worker_id,
                     'entities_processed': self.stats['entities_processed'],
-                    'success_rate': self._success_rate()
+                    'success_rate': self._success_rate(),
+                    'status': self.stats['status']
                 }))
+            
+            if pipe is None:
+                client.execute()
                 
         except Exception as e:
-            self.log(f"Redis update error: {e}")
+            self._stats_write_failed(e)
+    
+    def _stats_write_failed(self, error: Exception):
+        """A queued stats write never reached Redis - its counter deltas are lost"""
+        self.logger.warning(f"Redis update error: {error}")
+        # Re-seed the whole hash on the next update instead of sending deltas on top
+        self._pushed_stats = {}
     
     def _success_rate(self) -> float:
         """Calculate current success rate"""
@@ -257,6 +498,10 @@ class DonkeyWorker(ABC):
     
     def _create_checkpoint(self):
         """Create checkpoint for resuming"""
+        # Nothing new to record since the last checkpoint
+        if self.stats['entities_processed'] == self._checkpointed_at:
+            return
+        
         checkpoint = {
             'worker_id': self.config.worker_id,
             'stats': self.stats,
@@ -268,8 +513,13 @@ class DonkeyWorker(ABC):
             f'worker_{self.config.worker_id}_checkpoint.json'
         )
         
-        with open(checkpoint_file, 'w') as f:
-            json.dump(checkpoint, f, indent=2)
+        # Write-then-rename so a crash mid-write never leaves a torn checkpoint
+        tmp_file = checkpoint_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(serialization.dumps(checkpoint))
+        os.replace(tmp_file, checkpoint_file)
+        
+        self._checkpointed_at = self.stats['entities_processed']
     
     def run(self, entities: List[str]):
         """
@@ -278,39 +528,80 @@ class DonkeyWorker(ABC):
         Args:
             entities: List of entity identifiers to process
         """
-        self.log(f"Starting worker {self.config.worker_id}")
-        self.log(f"Processing {len(entities)} entities")
+        asyncio.run(self.run_async(entities))
+    
+    async def run_async(self, entities: List[str]):
+        """
+        Process entities with up to config.concurrency collections in flight.
         
-        self.stats['start_time'] = datetime.now().isoformat()
-        self.stats['status'] = 'running'
-        self._update_redis_stats()
+        The rate limit is shared by all in-flight collections, so concurrency
+        only helps when a single collect() takes longer than rate_limit. With
+        config.batch_size > 1, entities are collected through collect_batch()
+        and each batch takes one rate-limit slot (self.limiter) up front.
         
-        for entity in entities:
-            self.process_entity(entity)
-            self.stats['entities_processed'] += 1
+        Args:
+            entities: List of entity identifiers to process
+        """
+        self.logger.info(f"Starting worker {self.config.worker_id}")
+        self.logger.info(f"Processing {len(entities)} entities")
+        
+        client = connection.connect_async(self.config.redis_url, self._pool_size())
+        
+        try:
+            self.stats['start_time'] = datetime.now().isoformat()
+            self.stats['status'] = 'running'
+            await self._push_stats_async(client)
             
-            # Update global progress
-            self.redis.hincrby('collection:progress', 'total_processed', 1)
+            pending: asyncio.Queue = asyncio.Queue()
+            for entity in entities:
+                pending.put_nowait(entity)
             
-            # Rate limiting
-            time.sleep(self.config.rate_limit)
+            async def consume():
+                while not pending.empty():
+                    batch = [
+                        pending.get_nowait()
+                        for _ in range(min(max(1, self.config.batch_size), pending.qsize()))
+                    ]
+                    
+                    # Rate limiting - time spent collecting counts towards the interval
+                    wait = self.limiter.reserve()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    
+                    collected = await self._collect_batch(batch) if len(batch) > 1 else {}
+                    
+                    for entity in batch:
+                        await self.process_entity_async(entity, client, collected.get(entity))
+                        self.stats['entities_processed'] += 1
+                        
+                        # Checkpoint
+                        if self.stats['entities_processed'] % self.config.checkpoint_interval == 0:
+                            # Checkpoint only once the results it covers are on disk
+                            await asyncio.to_thread(self.flush_results)
+                            self._create_checkpoint()
+                            await self._push_stats_async(client)
+                            
+                            self.logger.info(
+                                f"Progress: {self.stats['entities_processed']}/{len(entities)}, "
+                                f"Success rate: {self._success_rate():.1f}%"
+                            )
             
-            # Checkpoint
-            if self.stats['entities_processed'] % self.config.checkpoint_interval == 0:
-                self._create_checkpoint()
-                self._update_redis_stats()
-                
-                self.log(
-                    f"Progress: {self.stats['entities_processed']}/{len(entities)}, "
-                    f"Success rate: {self._success_rate():.1f}%"
-                )
-        
-        # Final stats
-        self.stats['status'] = 'completed'
-        self.stats['end_time'] = datetime.now().isoformat()
-        self._update_redis_stats()
+            consumers = max(1, min(self.config.concurrency, len(entities)))
+            await asyncio.gather(*(consume() for _ in range(consumers)))
+            
+            # Final stats
+            await asyncio.to_thread(self.flush_results)
+            self.stats['status'] = 'completed'
+            self.stats['end_time'] = datetime.now().isoformat()
+            await self._push_stats_async(client)
+            
+        finally:
+            # aclose() replaced close() in redis-py 5; we own the pool, so drop it too
+            await getattr(client, 'aclose', client.close)()
+            await client.connection_pool.disconnect()
+            await asyncio.to_thread(self.close)
         
-        self.log(f"""
+        self.logger.info(f"""
 Worker {self.config.worker_id} Complete!
 ========================
 Processed: {self.stats['entities_processed']}
@@ -318,17 +609,41 @@ Successful: {self.stats['entities_successful']}
 Failed: {self.stats['entities_failed']}
 Success Rate: {self._success_rate():.1f}%
 """)
+    
+    async def _collect_batch(self, batch: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Collect a batch, leaving every entity to individual collection if it raises"""
+        try:
+            return await self.collect_batch_async(batch)
+        except Exception as e:
+            self.logger.warning(f"Batch collection failed, collecting individually: {e}")
+            return {}
+    
+    async def _push_stats_async(self, client):
+        """Send the current worker stats over an asyncio Redis client"""
+        pipe = client.pipeline(transaction=False)
+        self._update_redis_stats(pipe)
+        try:
+            await pipe.execute()
+        except redis.RedisError as e:
+            self._stats_write_failed(e)
 
 
 # Convenience function for simple cases
 def run_worker(worker_class, entities_file: str):
-    """Run a worker with entities from a file"""
-    with open(entities_file, 'r') as f:
-        all_entities = [line.strip() for line in f if line.strip()]
+    """Run a worker with entities from a file (or its pre-partitioned ENTITIES_FILE)"""
+    # Config from the environment (WORKER_ID, START_INDEX, ...)
+    worker = worker_class()
+    config = worker.config
     
-    config = WorkerConfig()
-    worker = worker_class(config)
+    if config.entities_file:
+        # Partition written for this worker - every line is ours
+        with open(config.entities_file, 'r') as f:
+            assigned = [line.strip() for line in f if line.strip()]
+    else:
+        with open(entities_file, 'r') as f:
+            all_entities = [line.strip() for line in f if line.strip()]
+        
+        # Get assigned range
+        assigned = all_entities[config.start_index:config.end_index]
     
-    # Get assigned range
-    assigned = all_entities[config.start_index:config.end_index]
     worker.run(assigned)
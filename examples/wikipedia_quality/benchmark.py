@@ -6,7 +6,7 @@ This script provides reproducible benchmarks for the Kong validation pattern.
 Run it to verify the claimed validation rates on your infrastructure.
 
 Usage:
-    python benchmark.py [--articles N] [--with-ollama]
+    python benchmark.py [--articles N] [--with-ollama] [--concurrency N] [--rate N] [--no-cache]
 
 Expected Results (baseline):
     - Collection success rate: 95%+ (Wikipedia API is reliable)
@@ -17,108 +17,552 @@ Expected Results (baseline):
 
 import json
 import time
+import os
+import re
+import asyncio
+import hashlib
 import argparse
+import contextlib
+import dataclasses
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import sys
 
 # Add parent to path for imports
 sys.path.insert(0, '../..')
 
 try:
-    from donkeykong.kong.adversarial import AdversarialValidator, OllamaAdversarialValidator
+    from donkeykong.kong.adversarial import (
+        AdversarialValidator, OllamaAdversarialValidator, ValidationResult
+    )
+    from donkeykong.core.cache import DiskCache, DEFAULT_CACHE_DIR
+    from donkeykong.core import serialization
+    from donkeykong.core.ratelimit import TokenBucket
     DONKEYKONG_AVAILABLE = True
 except ImportError:
     DONKEYKONG_AVAILABLE = False
     print("Warning: donkeykong not installed, using local implementation")
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
-def fetch_wikipedia_article(title: str) -> Dict:
-    """Fetch a Wikipedia article via API (no LLM, can't hallucinate)"""
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+API_URL = "https://en.wikipedia.org/w/api.php"
+USER_AGENT = "DonkeyKong/1.0 (Wikipedia Quality Benchmark)"
+
+# TextExtracts returns at most 20 intro extracts per query
+TITLES_PER_REQUEST = 20
+
+# Bump when _bulk_params or the record shape changes so cached articles are refetched
+CACHE_VERSION = "action-intro-v1"
+
+# Issue categories in priority order - each alternative is an anchored lookahead,
+# so the first category whose keyword appears anywhere in the issue wins
+_ISSUE_RE = re.compile(
+    r"^(?:(?=.*?(?P<confidence_mismatch>confidence))"
+    r"|(?=.*?(?P<missing_data>source|data))"
+    r"|(?=.*?(?P<score_issues>score|extreme))"
+    r"|(?=.*?(?P<missing_fields>field)))",
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def _chunks(items: List[str], size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _bulk_params(titles: List[str]) -> Dict:
+    """Action API query for the intro extract + description of many titles"""
+    return {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "prop": "extracts|description|info",
+        "exintro": 1,
+        "explaintext": 1,
+        "exlimit": "max",
+        "inprop": "url",
+        "redirects": 1,
+        "titles": "|".join(titles)
+    }
+
+
+def _article_result(title: str, page: Dict) -> Dict:
+    """Shape an API page into the record simulate_analysis expects"""
+    extract = page.get("extract", "")
+    return {
+        "success": True,
+        "title": page.get("title", title),
+        "extract": extract,
+        "extract_length": len(extract),
+        "description": page.get("description", ""),
+        "content_urls": {"desktop": {"page": page["fullurl"]}} if "fullurl" in page else {},
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def _error_result(title: str, error) -> Dict:
+    return {
+        "success": False,
+        "title": title,
+        "error": str(error),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def _demux_pages(titles: List[str], data: Dict) -> Dict[str, Dict]:
+    """Map a multi-title response back to the titles that were asked for"""
+    query = data.get("query", {})
+    pages = {page["title"]: page for page in query.get("pages", [])}
+    normalized = {n["from"]: n["to"] for n in query.get("normalized", [])}
+    redirects = {r["from"]: r["to"] for r in query.get("redirects", [])}
+    
+    results = {}
+    for title in titles:
+        resolved = normalized.get(title, title)
+        page = pages.get(redirects.get(resolved, resolved))
+        if page is None or page.get("missing") or page.get("invalid"):
+            results[title] = _error_result(title, "Article not found")
+        else:
+            results[title] = _article_result(title, page)
+    return results
+
+
+def fetch_wikipedia_articles_bulk(titles: List[str]) -> Dict[str, Dict]:
+    """
+    Fetch many Wikipedia articles via API (no LLM, can't hallucinate).
+    
+    Titles go TITLES_PER_REQUEST to a query, so N articles cost
+    ceil(N / 20) round trips. Results are keyed by the requested title.
+    """
     import urllib.request
     import urllib.parse
     
-    base_url = "https://en.wikipedia.org/api/rest_v1/page/summary/"
-    encoded_title = urllib.parse.quote(title.replace(' ', '_'))
+    results = {}
+    for chunk in _chunks(titles, TITLES_PER_REQUEST):
+        request = urllib.request.Request(
+            API_URL + "?" + urllib.parse.urlencode(_bulk_params(chunk)),
+            headers={"User-Agent": USER_AGENT}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                results.update(_demux_pages(chunk, json.loads(response.read().decode())))
+        except Exception as e:
+            results.update((title, _error_result(title, e)) for title in chunk)
+    return results
+
+
+def fetch_wikipedia_article(title: str) -> Dict:
+    """Fetch a single Wikipedia article via API"""
+    return fetch_wikipedia_articles_bulk([title])[title]
+
+
+async def fetch_wikipedia_articles_async(
+    session,
+    titles: List[str],
+    sem: asyncio.Semaphore,
+    limiter: Optional["TokenBucket"] = None
+) -> Dict[str, Dict]:
+    """
+    Fetch one chunk of titles without blocking the event loop.
     
-    try:
-        with urllib.request.urlopen(base_url + encoded_title, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            return {
-                "success": True,
-                "title": data.get("title", title),
-                "extract": data.get("extract", ""),
-                "extract_length": len(data.get("extract", "")),
-                "description": data.get("description", ""),
-                "content_urls": data.get("content_urls", {}),
-                "timestamp": datetime.now().isoformat()
-            }
-    except Exception as e:
-        return {
-            "success": False,
-            "title": title,
-            "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
+    Uses the shared aiohttp session when available, otherwise runs the
+    urllib bulk fetch in a thread. The semaphore bounds requests in flight;
+    the optional token bucket caps the request rate, only sleeping when
+    requests would otherwise go out faster than that.
+    """
+    async with sem:
+        if limiter is not None:
+            wait = limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        
+        if session is None:
+            return await asyncio.to_thread(fetch_wikipedia_articles_bulk, titles)
+        
+        try:
+            async with session.get(API_URL, params=_bulk_params(titles)) as response:
+                response.raise_for_status()
+                return _demux_pages(titles, await response.json())
+        except Exception as e:
+            return {title: _error_result(title, e) for title in titles}
 
 
-def simulate_analysis(raw_data: Dict) -> Dict:
+@contextlib.asynccontextmanager
+async def _session(concurrency: int):
+    """Shared aiohttp session, or None to fetch through urllib in threads"""
+    if not AIOHTTP_AVAILABLE:
+        yield None
+        return
+    
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": USER_AGENT},
+        timeout=aiohttp.ClientTimeout(total=10)
+    ) as session:
+        yield session
+
+
+# Length-driven decisions made by _score_lengths, packed as bit flags
+_LONG = 1          # > 500 chars
+_ADEQUATE = 2      # > 200 chars
+_SHORT = 4         # < 100 chars
+_SKIP_LENGTH = 8   # length % 3 == 0 - "forgets" to report it
+
+
+def _score_lengths(lengths, scores, confidences, flags):
     """
-    Simulate what an expensive LLM analysis might produce.
-    This is intentionally imperfect to test Kong's detection.
+    Fill scores/confidences/flags for each extract length.
+    
+    Pure numeric loop over indexable sequences - JIT-compiled with Numba
+    when it is installed, plain Python otherwise.
     """
-    if not raw_data.get("success"):
-        return {
-            "error": "No data to analyze",
-            "confidence": 0,
-            "quality_score": 0
-        }
+    for i in range(len(lengths)):
+        length = lengths[i]
+        scores[i] = 7.5 if length > 200 else 4.0
+        # Intentional flaw: high confidence despite short content
+        confidences[i] = 0.9 if length < 100 else 0.85  # Sometimes too high
+        flag = 0
+        if length > 500:
+            flag |= _LONG
+        if length > 200:
+            flag |= _ADEQUATE
+        if length < 100:
+            flag |= _SHORT
+        # Intentional flaw: sometimes forget to use all data (~33% of articles)
+        if length % 3 == 0:
+            flag |= _SKIP_LENGTH
+        flags[i] = flag
+
+
+if NUMBA_AVAILABLE:
+    _score_lengths = njit(cache=True)(_score_lengths)
+
+
+def _score_all(lengths: List[int]) -> Tuple:
+    """Run _score_lengths over all lengths at once (NumPy arrays under Numba)"""
+    n = len(lengths)
+    if NUMBA_AVAILABLE:
+        lengths = np.asarray(lengths, dtype=np.int64)
+        scores, confidences = np.empty(n), np.empty(n)
+        flags = np.empty(n, dtype=np.uint8)
+    else:
+        scores, confidences, flags = [0.0] * n, [0.0] * n, [0] * n
+    _score_lengths(lengths, scores, confidences, flags)
+    return scores, confidences, flags
+
+
+def simulate_analyses(raw_items: List[Dict]) -> List[Dict]:
+    """
+    Simulate what an expensive LLM analysis might produce, for many articles.
+    This is intentionally imperfect to test Kong's detection.
     
-    extract = raw_data.get("extract", "")
-    extract_length = len(extract)
+    The numeric decisions happen in one batched pass; only the findings
+    text is built per article.
+    """
+    lengths = [len(raw_data.get("extract", "")) for raw_data in raw_items]
+    scores, confidences, flags = _score_all(lengths)
     
-    # Simulate analysis with some intentional flaws
-    analysis = {
-        "title": raw_data.get("title"),
-        "quality_score": 7.5 if extract_length > 200 else 4.0,
-        "confidence": 0.85,  # Sometimes too high
-        "findings": [],
-        "recommendations": []
-    }
+    analyses = []
+    for i, raw_data in enumerate(raw_items):
+        if not raw_data.get("success"):
+            analyses.append({
+                "error": "No data to analyze",
+                "confidence": 0,
+                "quality_score": 0
+            })
+            continue
+        
+        flag = int(flags[i])
+        analysis = {
+            "title": raw_data.get("title"),
+            "quality_score": float(scores[i]),
+            "confidence": float(confidences[i]),
+            "findings": [],
+            "recommendations": []
+        }
+        
+        # Add findings based on content
+        if flag & _LONG:
+            analysis["findings"].append("Comprehensive article with substantial content")
+        if flag & _ADEQUATE:
+            analysis["findings"].append("Adequate length for topic coverage")
+        if flag & _SHORT:
+            analysis["findings"].append("Very short article")
+        
+        if raw_data.get("description"):
+            analysis["findings"].append(f"Topic: {raw_data['description']}")
+        
+        if not flag & _SKIP_LENGTH:
+            analysis["findings"].append(f"Content length: {lengths[i]} characters")
+        
+        # Add recommendations
+        if analysis["quality_score"] > 6:
+            analysis["recommendations"].append("Good reference article")
+        else:
+            analysis["recommendations"].append("May need supplementary sources")
+        
+        analyses.append(analysis)
     
-    # Add findings based on content
-    if extract_length > 500:
-        analysis["findings"].append("Comprehensive article with substantial content")
-    if extract_length > 200:
-        analysis["findings"].append("Adequate length for topic coverage")
-    if extract_length < 100:
-        analysis["findings"].append("Very short article")
-        # Intentional flaw: high confidence despite short content
-        analysis["confidence"] = 0.9
+    return analyses
+
+
+def simulate_analysis(raw_data: Dict) -> Dict:
+    """Simulate the analysis of a single article (see simulate_analyses)"""
+    return simulate_analyses([raw_data])[0]
+
+
+def _digest(obj) -> str:
+    """Short content hash of a JSON-serializable object"""
+    return hashlib.blake2b(serialization.dumps(obj), digest_size=16).hexdigest()
+
+
+class CachedValidator:
+    """
+    Memoize validator.validate() by the content of its inputs.
     
-    if raw_data.get("description"):
-        analysis["findings"].append(f"Topic: {raw_data['description']}")
+    Two layers: a sliding window of the last few results, which catches
+    repeats within a run (duplicate titles, redirects to the same page), and
+    an optional disk cache that persists across runs - on warm runs the
+    inputs are identical (articles come from the fetch cache), so validation
+    collapses to lookups.
+    """
     
-    # Intentional flaw: sometimes forget to use all data
-    if extract_length % 3 == 0:  # ~33% of articles
-        # Don't mention extract_length in findings
-        pass
-    else:
-        analysis["findings"].append(f"Content length: {extract_length} characters")
+    def __init__(self, validator, cache=None, window: int = 5):
+        self.validator = validator
+        self.cache = cache
+        self.window = window
+        self._recent: OrderedDict = OrderedDict()
+        self.window_hits = 0
+        self.hits = 0
+    
+    def validate(self, title: str, analysis: Dict, raw_data: Dict):
+        signature, result = self.lookup(analysis, raw_data)
+        if result is None:
+            result = self.validator.validate(title, analysis, raw_data)
+            self.store(signature, result)
+        return result
+    
+    def lookup(self, analysis: Dict, raw_data: Dict) -> Tuple:
+        """Return (signature, cached result or None)"""
+        # validate() reads neither the entity id nor the fetch time - key on
+        # the content it does read, so different titles can share a result
+        signature = (
+            _digest(analysis),
+            _digest({k: v for k, v in raw_data.items() if k != "timestamp"})
+        )
+        
+        result = self._recent.get(signature)
+        if result is not None:
+            self._recent.move_to_end(signature)
+            self.window_hits += 1
+            return signature, result
+        
+        cached = self.cache.get(self.cache.key(*signature)) if self.cache is not None else None
+        if cached is not None:
+            self.hits += 1
+            result = ValidationResult(**cached)
+            self._remember(signature, result)
+        return signature, result
+    
+    def store(self, signature: Tuple, result):
+        """Record a result computed for signature (e.g. in another process)"""
+        if self.cache is not None:
+            self.cache.set(self.cache.key(*signature), dataclasses.asdict(result))
+        self._remember(signature, result)
+    
+    def _remember(self, signature: Tuple, result):
+        self._recent[signature] = result
+        if len(self._recent) > self.window:
+            self._recent.popitem(last=False)
+
+
+def _validate_chunk(validator, items: List[Tuple]) -> List[Tuple]:
+    """Validate (title, analysis, raw_data) items, returning (title, result) pairs"""
+    return [
+        (title, validator.validate(title, analysis, raw_data))
+        for title, analysis, raw_data in items
+    ]
+
+
+async def _run_pipeline(
+    titles: List[str],
+    validator,
+    cache=None,
+    concurrency: int = 10,
+    verbose: bool = True,
+    validation_workers: int = 1,
+    rate: float = 10.0
+) -> Dict:
+    """
+    Stream articles through collection -> analysis -> validation.
     
-    # Add recommendations
-    if analysis["quality_score"] > 6:
-        analysis["recommendations"].append("Good reference article")
-    else:
-        analysis["recommendations"].append("May need supplementary sources")
+    Each fetched chunk flows straight into analysis and then validation over
+    bounded queues, so network latency overlaps the CPU-bound stages and only
+    a few chunks are held in memory at a time. With validation_workers > 1,
+    rule-based validation of cache misses fans out over a process pool.
     
-    return analysis
+    Returns:
+        Dict with "collected" (title -> error, None on success), "cache_hits",
+        "validated" ((title, result) pairs in input order) and per-stage
+        busy "timing" in seconds
+    """
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(concurrency)
+    # Be respectful to Wikipedia API - at most `rate` queries per second
+    limiter = TokenBucket(1 / rate, burst=int(rate)) if rate > 0 else None
+    # Bounded queues backpressure the fetchers when a later stage falls behind
+    to_analyze: asyncio.Queue = asyncio.Queue(maxsize=2 * concurrency)
+    to_validate: asyncio.Queue = asyncio.Queue(maxsize=2 * concurrency)
+    
+    collected: Dict[str, Optional[str]] = {}
+    validated: List[Tuple] = []
+    timing = {"collection_seconds": 0.0, "analysis_seconds": 0.0, "validation_seconds": 0.0}
+    cache_hits = 0
+    
+    async def collect(chunk: List[Tuple]):
+        for title, raw_data in chunk:
+            collected[title] = None if raw_data["success"] else raw_data.get("error", "Unknown")
+        await to_analyze.put(chunk)
+    
+    async def fetch(session, titles_chunk: List[str]):
+        raws = await fetch_wikipedia_articles_async(session, titles_chunk, sem, limiter)
+        # Only cache real articles - failures should be retried next run
+        if cache is not None:
+            for title, raw_data in raws.items():
+                if raw_data["success"]:
+                    cache.set(cache.key(title), raw_data)
+        await collect([(title, raws[title]) for title in titles_chunk])
+        if verbose:
+            print(f"  Collected {len(collected)}/{len(titles)} articles")
+    
+    async def analyze():
+        while (chunk := await to_analyze.get()) is not None:
+            start = time.time()
+            successful = [(title, raw_data) for title, raw_data in chunk if raw_data["success"]]
+            batch = await loop.run_in_executor(
+                executor, simulate_analyses, [raw_data for _, raw_data in successful]
+            )
+            timing["analysis_seconds"] += time.time() - start
+            await to_validate.put([
+                (title, analysis, raw_data)
+                for (title, raw_data), analysis in zip(successful, batch)
+            ])
+        await to_validate.put(None)
+    
+    async def validate():
+        while (items := await to_validate.get()) is not None:
+            start = time.time()
+            validated.extend(await loop.run_in_executor(executor, _validate_chunk, validator, items))
+            timing["validation_seconds"] += time.time() - start
+    
+    # Rule-based validation is pure CPU and stateless - spread it over processes.
+    # Ollama validation waits on HTTP, so it stays on the validation thread.
+    parallel = validation_workers > 1 and \
+        not isinstance(validator.validator, OllamaAdversarialValidator)
+    busy = 0
+    busy_since = 0.0
+    
+    async def validate_chunk(items: List[Tuple]):
+        nonlocal busy, busy_since
+        if busy == 0:
+            busy_since = time.time()
+        busy += 1
+        
+        # Cache lookups stay in this process; only misses are shipped out
+        lookups = [validator.lookup(analysis, raw_data) for _, analysis, raw_data in items]
+        misses = [item for item, (_, result) in zip(items, lookups) if result is None]
+        computed = iter(await loop.run_in_executor(
+            process_pool, _validate_chunk, validator.validator, misses
+        ) if misses else [])
+        for (title, _, _), (signature, result) in zip(items, lookups):
+            if result is None:
+                _, result = next(computed)
+                validator.store(signature, result)
+            validated.append((title, result))
+        
+        busy -= 1
+        if busy == 0:
+            timing["validation_seconds"] += time.time() - busy_since
+    
+    async def validate_parallel():
+        tasks = []
+        while (items := await to_validate.get()) is not None:
+            tasks.append(asyncio.create_task(validate_chunk(items)))
+        await asyncio.gather(*tasks)
+    
+    # One thread per CPU-bound stage keeps them off the event loop
+    with ThreadPoolExecutor(max_workers=2) as executor, \
+            (ProcessPoolExecutor(max_workers=validation_workers) if parallel
+             else contextlib.nullcontext()) as process_pool:
+        stages = [
+            asyncio.create_task(analyze()),
+            asyncio.create_task(validate_parallel() if parallel else validate())
+        ]
+        collection_start = time.time()
+        
+        # Warm runs read articles back from disk instead of the network
+        misses = []
+        cached = []
+        for title in titles:
+            raw_data = cache.get(cache.key(title)) if cache is not None else None
+            if raw_data is None:
+                misses.append(title)
+                continue
+            cache_hits += 1
+            cached.append((title, raw_data))
+            if len(cached) == TITLES_PER_REQUEST:
+                await collect(cached)
+                cached = []
+        if cached:
+            await collect(cached)
+        
+        # Batched queries, overlapped - semaphore and token bucket keep us respectful to Wikipedia API
+        async with _session(concurrency) as session:
+            await asyncio.gather(*[fetch(session, chunk) for chunk in _chunks(misses, TITLES_PER_REQUEST)])
+        timing["collection_seconds"] = time.time() - collection_start
+        
+        await to_analyze.put(None)
+        await asyncio.gather(*stages)
+    
+    # Chunks finish out of order - report in input order
+    position = {title: i for i, title in enumerate(titles)}
+    validated.sort(key=lambda item: position[item[0]])
+    
+    return {
+        "collected": collected,
+        "cache_hits": cache_hits,
+        "validated": validated,
+        "timing": timing
+    }
 
 
 def run_benchmark(
     article_titles: List[str],
     use_ollama: bool = False,
-    verbose: bool = True
+    verbose: bool = True,
+    concurrency: int = 10,
+    use_cache: bool = True,
+    validation_workers: int = 1,
+    rate: float = 10.0
 ) -> Dict:
     """
     Run the full benchmark pipeline.
@@ -132,6 +576,7 @@ def run_benchmark(
         "collection": {
             "success": 0,
             "failed": 0,
+            "cache_hits": 0,
             "errors": []
         },
         "validation": {
@@ -139,7 +584,9 @@ def run_benchmark(
             "flagged": 0,
             "issues_by_type": {},
             "confidence_scores": [],
-            "flagged_articles": []
+            "flagged_articles": [],
+            "cache_hits": 0,
+            "window_hits": 0
         },
         "timing": {
             "collection_seconds": 0,
@@ -161,67 +608,64 @@ def run_benchmark(
     else:
         validator = AdversarialValidator()
     
-    collected_data = []
-    analyses = []
-    
-    # Phase 1: Collection (mechanical, can't hallucinate)
+    # Warm up outside the measured region - Numba compiles _score_lengths on
+    # first call (or loads it from its on-disk cache), Ollama loads the model
+    simulate_analyses([{"success": True, "extract": "x" * 300}])
+    validator.validate("_warmup", {"quality_score": 5, "confidence": 0.5},
+                       {"success": True, "extract": "x" * 300})
+    
+    # Warm runs read articles - and their validations - back from disk
+    cache = validation_cache = None
+    if use_cache:
+        cache = DiskCache(os.path.join(DEFAULT_CACHE_DIR, "wiki"), version=CACHE_VERSION)
+        # Keyed per validator, so rule-based and Ollama results never mix
+        validation_cache = DiskCache(
+            os.path.join(DEFAULT_CACHE_DIR, "validation"),
+            version=f"{type(validator).__name__}:{getattr(validator, 'model', '')}:v1"
+        )
+    validator = CachedValidator(validator, validation_cache)
+    
+    # Phases 1-3 run as a pipeline: collection (mechanical, can't hallucinate)
+    # feeds analysis (simulated expensive LLM) feeds Kong validation (cheap, adversarial)
     if verbose:
         print(f"\n{'='*60}")
-        print("PHASE 1: MECHANICAL COLLECTION")
+        print("PIPELINE: COLLECTION -> SIMULATED ANALYSIS -> KONG VALIDATION")
         print(f"{'='*60}")
     
-    collection_start = time.time()
-    for i, title in enumerate(article_titles):
-        raw_data = fetch_wikipedia_article(title)
-        collected_data.append((title, raw_data))
-        
-        if raw_data["success"]:
+    pipeline_start = time.time()
+    pipeline = asyncio.run(_run_pipeline(
+        article_titles, validator, cache, concurrency, verbose, validation_workers, rate
+    ))
+    for stage, seconds in pipeline["timing"].items():
+        results["timing"][stage] = round(seconds, 2)
+    results["timing"]["wall_seconds"] = round(time.time() - pipeline_start, 2)
+    results["collection"]["cache_hits"] = pipeline["cache_hits"]
+    results["validation"]["cache_hits"] = validator.hits
+    results["validation"]["window_hits"] = validator.window_hits
+    
+    for title in article_titles:
+        error = pipeline["collected"][title]
+        if error is None:
             results["collection"]["success"] += 1
         else:
             results["collection"]["failed"] += 1
             results["collection"]["errors"].append({
                 "title": title,
-                "error": raw_data.get("error", "Unknown")
+                "error": error
             })
-        
-        if verbose and (i + 1) % 10 == 0:
-            print(f"  Collected {i + 1}/{len(article_titles)} articles")
-        
-        time.sleep(0.1)  # Be respectful to Wikipedia API
     
-    results["timing"]["collection_seconds"] = round(time.time() - collection_start, 2)
-    
-    if verbose:
-        print(f"\n  Collection complete: {results['collection']['success']}/{len(article_titles)} success")
-    
-    # Phase 2: Analysis (simulated expensive LLM)
     if verbose:
-        print(f"\n{'='*60}")
-        print("PHASE 2: SIMULATED ANALYSIS (would be Claude/GPT-4)")
-        print(f"{'='*60}")
-    
-    analysis_start = time.time()
-    for title, raw_data in collected_data:
-        if raw_data["success"]:
-            analysis = simulate_analysis(raw_data)
-            analyses.append((title, analysis, raw_data))
+        print(f"\n  Collection complete: {results['collection']['success']}/{len(article_titles)} success "
+              f"({results['collection']['cache_hits']} from cache)")
+        print(f"  Analyzed and validated {len(pipeline['validated'])} articles "
+              f"({results['validation']['cache_hits']} validations from cache)")
     
-    results["timing"]["analysis_seconds"] = round(time.time() - analysis_start, 2)
-    
-    if verbose:
-        print(f"  Analyzed {len(analyses)} articles")
+    # Scores land in a preallocated array when NumPy is available (one-pass stats below)
+    validated = len(pipeline["validated"])
+    scores = np.empty(validated) if NUMPY_AVAILABLE else [0.0] * validated
     
-    # Phase 3: Kong Validation (cheap, adversarial)
-    if verbose:
-        print(f"\n{'='*60}")
-        print("PHASE 3: KONG ADVERSARIAL VALIDATION")
-        print(f"{'='*60}")
-    
-    validation_start = time.time()
-    for title, analysis, raw_data in analyses:
-        result = validator.validate(title, analysis, raw_data)
-        
-        results["validation"]["confidence_scores"].append(result.overall_confidence)
+    for i, (title, result) in enumerate(pipeline["validated"]):
+        scores[i] = result.overall_confidence
         
         if result.should_rerun:
             results["validation"]["flagged"] += 1
@@ -237,28 +681,23 @@ def run_benchmark(
         # Track issue types
         for issue in result.issues_found:
             # Categorize issues
-            if "confidence" in issue.lower():
-                category = "confidence_mismatch"
-            elif "source" in issue.lower() or "data" in issue.lower():
-                category = "missing_data"
-            elif "score" in issue.lower() or "extreme" in issue.lower():
-                category = "score_issues"
-            elif "field" in issue.lower():
-                category = "missing_fields"
-            else:
-                category = "other"
+            match = _ISSUE_RE.match(issue)
+            category = match.lastgroup if match else "other"
             
             results["validation"]["issues_by_type"][category] = \
                 results["validation"]["issues_by_type"].get(category, 0) + 1
     
-    results["timing"]["validation_seconds"] = round(time.time() - validation_start, 2)
-    
     # Calculate summary statistics
-    if results["validation"]["confidence_scores"]:
-        scores = results["validation"]["confidence_scores"]
-        results["validation"]["avg_confidence"] = round(sum(scores) / len(scores), 3)
-        results["validation"]["min_confidence"] = round(min(scores), 3)
-        results["validation"]["max_confidence"] = round(max(scores), 3)
+    if validated:
+        if NUMPY_AVAILABLE:
+            avg, low, high = float(scores.mean()), float(scores.min()), float(scores.max())
+            scores = scores.tolist()
+        else:
+            avg, low, high = sum(scores) / validated, min(scores), max(scores)
+        results["validation"]["confidence_scores"] = scores
+        results["validation"]["avg_confidence"] = round(avg, 3)
+        results["validation"]["min_confidence"] = round(low, 3)
+        results["validation"]["max_confidence"] = round(high, 3)
     
     results["benchmark_end"] = datetime.now().isoformat()
     
@@ -282,12 +721,15 @@ def run_benchmark(
         for issue_type, count in sorted(results["validation"]["issues_by_type"].items(), 
                                          key=lambda x: x[1], reverse=True):
             print(f"    {issue_type}: {count}")
-        print(f"\n  Timing:")
+        print(f"\n  Timing (stages overlap):")
         print(f"    Collection: {results['timing']['collection_seconds']}s")
         print(f"    Analysis: {results['timing']['analysis_seconds']}s")
         print(f"    Validation: {results['timing']['validation_seconds']}s")
-        total_time = sum(results['timing'].values())
-        print(f"    Total: {total_time:.1f}s")
+        print(f"    Total: {results['timing']['wall_seconds']:.1f}s")
+        reused = results["validation"]["window_hits"] + results["validation"]["cache_hits"]
+        print(f"    Validation reuse: {reused}/{validated} "
+              f"({results['validation']['window_hits']} in-run, "
+              f"{results['validation']['cache_hits']} from disk)")
         print(f"\n  Articles flagged for review:")
         for article in results["validation"]["flagged_articles"][:5]:
             print(f"    - {article['title']}: {article['issues'][0] if article['issues'] else 'No specific issue'}")
@@ -305,6 +747,14 @@ def main():
                         help="Save results to JSON file")
     parser.add_argument("--quiet", action="store_true",
                         help="Minimal output")
+    parser.add_argument("--concurrency", type=int, default=10,
+                        help="Max Wikipedia requests in flight (default: 10)")
+    parser.add_argument("--rate", type=float, default=10.0,
+                        help="Max Wikipedia queries per second, 0 for no limit (default: 10)")
+    parser.add_argument("--validation-workers", type=int, default=1,
+                        help="Processes for rule-based validation (default: 1, in-process)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always fetch and validate, ignoring cached articles and validations")
     args = parser.parse_args()
     
     # Load article list
@@ -332,13 +782,17 @@ def main():
     results = run_benchmark(
         articles,
         use_ollama=args.with_ollama,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        concurrency=args.concurrency,
+        use_cache=not args.no_cache,
+        validation_workers=args.validation_workers,
+        rate=args.rate
     )
     
     # Save results if requested
     if args.output:
-        with open(args.output, "w") as f:
-            json.dump(results, f, indent=2)
+        with open(args.output, "wb") as f:
+            f.write(serialization.dumps(results, indent=True))
         print(f"\nResults saved to {args.output}")
     
     # Return exit code based on results
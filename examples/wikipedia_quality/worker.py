@@ -6,17 +6,51 @@ and uses Kong (local LLM) to assess quality.
 """
 
 import os
+import re
 import json
+import functools
 import requests
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List
 
 # Add parent to path for imports
 import sys
 sys.path.insert(0, '/app')
 
-from donkeykong.core.worker import DonkeyWorker, WorkerConfig, run_worker
+from donkeykong.core.worker import DonkeyWorker
+from donkeykong.core.cache import DiskCache, DEFAULT_CACHE_DIR
+from donkeykong.core import serialization
 from donkeykong.kong.validator import OllamaValidator
 
+API_URL = "https://en.wikipedia.org/w/api.php"
+
+# The API accepts up to 50 titles per query
+MAX_BATCH_TITLES = 50
+# Smaller chunks used when a full batch is refused (URL too long / throttled)
+FALLBACK_BATCH_TITLES = 20
+
+# Likely section headers: a whole line under 100 chars, no surrounding whitespace,
+# no wiki markup ('==', '{{', '|')
+_HEADER_RE = re.compile(r'^(?!.*(?:==|\{\{|\|))\S(?:.{0,97}\S)?$', re.MULTILINE)
+
+# Citation markers, counted in one case-insensitive pass (ASCII folding, as lower() does here)
+_CITE_RE = re.compile(r'\[citation|references', re.IGNORECASE | re.ASCII)
+
+# Bump when the query params or result shape change so cached articles are refetched
+CACHE_VERSION = 'query-full-v1'
+
+
+@functools.lru_cache(maxsize=8192)
+def _display_title(entity: str) -> str:
+    """Entity id -> API title, memoized across batches, retries and demuxing"""
+    return entity.replace('_', ' ')
+
+
+def _chunks(items: List[str], size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
 
 class WikipediaWorker(DonkeyWorker):
     """
@@ -30,11 +64,32 @@ class WikipediaWorker(DonkeyWorker):
     def __init__(self, config=None):
         super().__init__(config)
         
-        # Setup HTTP session
+        # Setup HTTP session - keep connections alive for the worker's lifetime
+        # so each article skips the TCP + TLS handshake
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'DonkeyKong/1.0 (Wikipedia Quality Example)'
+            'User-Agent': 'DonkeyKong/1.0 (Wikipedia Quality Example)',
+            'Connection': 'keep-alive'
         })
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(16, self.config.concurrency),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Retries and re-runs read articles back from disk (WIKI_CACHE=0 disables)
+        self.cache = None
+        if os.environ.get('WIKI_CACHE', '1') != '0':
+            self.cache = DiskCache(
+                os.environ.get('WIKI_CACHE_DIR', os.path.join(DEFAULT_CACHE_DIR, 'wiki')),
+                version=CACHE_VERSION
+            )
         
         # Setup Kong validator with custom prompt
         ollama_url = os.environ.get('OLLAMA_URL', 'http://host.docker.internal:11434')
@@ -75,14 +130,17 @@ Respond with ONLY valid JSON:
         Returns:
             Dictionary with article data
         """
+        cached = self._cached(entity)
+        if cached is not None:
+            return cached
+        
         self.log(f"Fetching Wikipedia article: {entity}")
         
         try:
             # Use Wikipedia API
-            url = "https://en.wikipedia.org/w/api.php"
             params = {
                 'action': 'query',
-                'titles': entity.replace('_', ' '),
+                'titles': _display_title(entity),
                 'prop': 'extracts|info|categories|links',
                 'exintro': False,
                 'explaintext': True,
@@ -92,51 +150,18 @@ Respond with ONLY valid JSON:
                 'format': 'json'
             }
             
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(API_URL, params=params, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            # Parse the raw bytes directly (orjson when installed) - full-text
+            # extracts make these responses large
+            data = serialization.loads(response.content)
             pages = data.get('query', {}).get('pages', {})
             
             # Get the first (and usually only) page
-            page = list(pages.values())[0]
+            page = next(iter(pages.values()))
             
-            if 'missing' in page:
-                return {
-                    'error': f'Article not found: {entity}',
-                    'title': entity
-                }
-            
-            # Extract relevant data
-            extract = page.get('extract', '')
-            categories = [c['title'] for c in page.get('categories', [])]
-            links = [l['title'] for l in page.get('links', [])]
-            
-            # Count approximate citations (links to reference sections)
-            citation_indicators = extract.lower().count('[citation') + \
-                                  extract.lower().count('references')
-            
-            # Identify sections by looking for headers in extract
-            sections = []
-            for line in extract.split('\n'):
-                if line.strip() and len(line) < 100 and line == line.strip():
-                    # Likely a section header
-                    if not any(c in line for c in ['==', '{{', '|']):
-                        sections.append(line)
-            
-            return {
-                'title': page.get('title', entity),
-                'page_id': page.get('pageid'),
-                'url': page.get('fullurl', f'https://en.wikipedia.org/wiki/{entity}'),
-                'content_length': len(extract),
-                'extract_preview': extract[:500] + '...' if len(extract) > 500 else extract,
-                'sections_detected': len(sections),
-                'sections': sections[:10],  # First 10 sections
-                'categories': categories,
-                'internal_links': len(links),
-                'citation_indicators': citation_indicators,
-                'last_touched': page.get('touched')
-            }
+            return self._store(entity, self._build_result(entity, page))
             
         except requests.RequestException as e:
             return {
@@ -148,6 +173,152 @@ Respond with ONLY valid JSON:
                 'error': f'Unexpected error: {str(e)}',
                 'title': entity
             }
+    
+    def collect_batch(self, entities: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch many articles with one multi-title API query per 50 titles.
+        
+        Args:
+            entities: Wikipedia article titles
+            
+        Returns:
+            Article data keyed by entity, same shape as collect()
+        """
+        results = {}
+        for entity in entities:
+            cached = self._cached(entity)
+            if cached is not None:
+                results[entity] = cached
+        
+        misses = [entity for entity in entities if entity not in results]
+        if misses:
+            self.log(f"Fetching {len(misses)} Wikipedia articles")
+        
+        for i, chunk in enumerate(_chunks(misses, MAX_BATCH_TITLES)):
+            if i:
+                self.limiter.acquire()  # run_async paid for the first request only
+            try:
+                results.update(self._collect_chunk(chunk))
+            except requests.exceptions.RetryError:
+                # The adapter retries 429s itself - running out of retries means still throttled
+                results.update(self._collect_small_chunks(chunk))
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code not in (414, 429):
+                    raise
+                results.update(self._collect_small_chunks(chunk))
+        
+        return results
+    
+    def _collect_small_chunks(self, entities: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retry a refused batch as FALLBACK_BATCH_TITLES-title queries"""
+        results = {}
+        for small_chunk in _chunks(entities, FALLBACK_BATCH_TITLES):
+            self.limiter.acquire()
+            results.update(self._collect_chunk(small_chunk))
+        return results
+    
+    def _collect_chunk(self, entities: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run one multi-title query and demux its pages back to entities"""
+        params = {
+            'action': 'query',
+            'titles': '|'.join(map(_display_title, entities)),
+            'prop': 'extracts|info|categories|links',
+            'exintro': False,
+            'explaintext': True,
+            'inprop': 'url|displaytitle',
+            'cllimit': 'max',
+            'pllimit': 'max',
+            'format': 'json'
+        }
+        
+        # Full-text extracts and the category/link lists are shared across
+        # all titles and paged - follow continuation until every page is whole.
+        # Full extracts come one page per request, so each continuation takes
+        # its own rate-limit slot rather than riding on the batch's one.
+        pages: Dict[str, Dict[str, Any]] = {}
+        normalized = {}
+        cont: Dict[str, Any] = {}
+        while True:
+            if cont:
+                self.limiter.acquire()
+            response = self.session.get(API_URL, params={**params, **cont}, timeout=30)
+            response.raise_for_status()
+            data = serialization.loads(response.content)
+            query = data.get('query', {})
+            
+            for n in query.get('normalized', []):
+                normalized[n['from']] = n['to']
+            for page in query.get('pages', {}).values():
+                merged = pages.setdefault(page['title'], {})
+                for key, value in page.items():
+                    if isinstance(value, list):
+                        merged.setdefault(key, []).extend(value)
+                    else:
+                        merged[key] = value
+            
+            if 'continue' not in data:
+                break
+            cont = data['continue']
+        
+        results = {}
+        for entity in entities:
+            title = _display_title(entity)
+            page = pages.get(normalized.get(title, title))
+            if page is None:
+                results[entity] = {
+                    'error': f'Article not returned by API: {entity}',
+                    'title': entity
+                }
+            else:
+                # Trim to the limits a single-title collect() requests
+                page['categories'] = page.get('categories', [])[:20]
+                page['links'] = page.get('links', [])[:50]
+                results[entity] = self._store(entity, self._build_result(entity, page))
+        return results
+    
+    def _cached(self, entity: str):
+        """Article data from the disk cache, or None"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.cache.key(entity))
+    
+    def _store(self, entity: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a successfully fetched article and pass it through"""
+        if self.cache is not None and 'error' not in result:
+            self.cache.set(self.cache.key(entity), result)
+        return result
+    
+    def _build_result(self, entity: str, page: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn an API page object into the article data Kong validates"""
+        if 'missing' in page or 'invalid' in page:
+            return {
+                'error': f'Article not found: {entity}',
+                'title': entity
+            }
+        
+        # Extract relevant data
+        extract = page.get('extract', '')
+        categories = [c['title'] for c in page.get('categories', [])]
+        
+        # Count approximate citations (links to reference sections)
+        citation_indicators = len(_CITE_RE.findall(extract))
+        
+        # Identify sections by looking for headers in extract
+        sections = _HEADER_RE.findall(extract)
+        
+        return {
+            'title': page.get('title', entity),
+            'page_id': page.get('pageid'),
+            'url': page.get('fullurl', f'https://en.wikipedia.org/wiki/{entity}'),
+            'content_length': len(extract),
+            'extract_preview': extract[:500] + '...' if len(extract) > 500 else extract,
+            'sections_detected': len(sections),
+            'sections': sections[:10],  # First 10 sections
+            'categories': categories,
+            'internal_links': len(page.get('links', [])),
+            'citation_indicators': citation_indicators,
+            'last_touched': page.get('touched')
+        }
 
 
 def main():
@@ -168,9 +339,10 @@ def main():
             'Natural_language_processing'
         ]
     
-    # Create worker and run
-    config = WorkerConfig()
-    worker = WikipediaWorker(config)
+    # Create worker and run - config comes from the environment (WORKER_ID,
+    # START_INDEX, BATCH_SIZE, ...) as set per container in docker-compose.yml
+    worker = WikipediaWorker()
+    config = worker.config
     
     # Get assigned range
     assigned = all_articles[config.start_index:config.end_index]
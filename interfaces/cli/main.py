@@ -16,12 +16,16 @@ import json
 import sys
 import os
 from pathlib import Path
+from typing import Optional
+
+# Redis keys fetched / deleted per pipeline round trip
+REDIS_BATCH_SIZE = 500
 
 
 def cmd_collect(args):
     """Start a collection job"""
-    from ..core.worker import WorkerConfig
-    from ..core.monitor import DonkeyMonitor, MonitorConfig
+    from ...core.worker import WorkerConfig
+    from ...core.monitor import DonkeyMonitor, MonitorConfig
     
     # Load entities
     with open(args.entities_file, 'r') as f:
@@ -43,6 +47,7 @@ def cmd_collect(args):
     # Generate docker-compose
     compose = generate_docker_compose(
         workers=args.workers,
+        total_entities=len(entities),
         entities_file=args.entities_file,
         rate_limit=args.rate_limit,
         validator=args.validator
@@ -64,34 +69,39 @@ def cmd_collect(args):
 def cmd_status(args):
     """Get current status"""
     import redis
+    from ...core.worker import PROGRESS_KEY
     
     redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379')
     
     try:
-        r = redis.from_url(redis_url)
-        progress = r.hgetall('collection:progress')
+        r = redis.from_url(redis_url, decode_responses=True)
         
-        def decode(val):
-            if isinstance(val, bytes):
-                return val.decode()
-            return val
+        # Find every worker (any deployment size), then fetch all stats in one round trip
+        keys = list(r.scan_iter(match='worker:*:stats', count=REDIS_BATCH_SIZE))
+        pipe = r.pipeline(transaction=False)
+        pipe.hgetall(PROGRESS_KEY)
+        for key in keys:
+            pipe.hgetall(key)
+        progress, *all_stats = pipe.execute()
         
-        total_processed = int(decode(progress.get(b'total_processed', 0)) or 0)
-        total_successful = int(decode(progress.get(b'total_successful', 0)) or 0)
-        total_failed = int(decode(progress.get(b'total_failed', 0)) or 0)
+        total_processed = int(progress.get('total_processed', 0) or 0)
+        total_successful = int(progress.get('total_successful', 0) or 0)
+        total_failed = int(progress.get('total_failed', 0) or 0)
         
         success_rate = (total_successful / max(total_processed, 1)) * 100
         
         # Get worker stats
-        workers = []
-        for i in range(1, 11):
-            stats = r.hgetall(f'worker:{i}:stats')
-            if stats:
-                workers.append({
-                    'id': i,
-                    'status': decode(stats.get(b'status', b'unknown')),
-                    'processed': decode(stats.get(b'entities_processed', b'0'))
-                })
+        workers = sorted(
+            (
+                {
+                    'id': int(key.split(':')[1]),
+                    'status': stats.get('status', 'unknown'),
+                    'processed': stats.get('entities_processed', '0')
+                }
+                for key, stats in zip(keys, all_stats) if stats
+            ),
+            key=lambda w: w['id']
+        )
         
         active = sum(1 for w in workers if w['status'] == 'running')
         
@@ -123,20 +133,31 @@ def cmd_failures(args):
     redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379')
     
     try:
-        r = redis.from_url(redis_url)
+        r = redis.from_url(redis_url, decode_responses=True)
         
         failures = []
-        for key in r.scan_iter('failures:*'):
-            if len(failures) >= args.limit:
+        keys = []
+        
+        def fetch(keys):
+            # One round trip per batch of keys instead of one per failure
+            pipe = r.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(key)
+            for key, data in zip(keys, pipe.execute()):
+                failures.append({
+                    'entity': key.split(':', 1)[1],
+                    'error': data.get('error', 'Unknown')
+                })
+        
+        for key in r.scan_iter('failures:*', count=REDIS_BATCH_SIZE):
+            if len(failures) + len(keys) >= args.limit:
                 break
-            
-            data = r.hgetall(key)
-            entity = key.decode().split(':')[1] if isinstance(key, bytes) else key.split(':')[1]
-            
-            failures.append({
-                'entity': entity,
-                'error': data.get(b'error', b'').decode() if b'error' in data else 'Unknown'
-            })
+            keys.append(key)
+            if len(keys) >= REDIS_BATCH_SIZE:
+                fetch(keys)
+                keys = []
+        if keys:
+            fetch(keys)
         
         if not failures:
             print("✅ No failures!")
@@ -162,26 +183,30 @@ def cmd_failures(args):
 def cmd_retry(args):
     """Retry failures"""
     import redis
+    from ...core.worker import FAILURES_RECENT_KEY
     
     redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379')
     
     try:
-        r = redis.from_url(redis_url)
+        r = redis.from_url(redis_url, decode_responses=True)
         
         # Collect failures
-        to_retry = []
-        for key in r.scan_iter('failures:*'):
-            entity = key.decode().split(':')[1] if isinstance(key, bytes) else key.split(':')[1]
-            to_retry.append(entity)
-            r.delete(key)
+        keys = list(r.scan_iter('failures:*', count=REDIS_BATCH_SIZE))
+        to_retry = [key.split(':', 1)[1] for key in keys]
         
         if not to_retry:
             print("✅ No failures to retry")
             return
         
-        # Queue for retry
-        for entity in to_retry:
-            r.rpush('job:retry', entity)
+        # Clear (records and their recent-failures index entries) and queue
+        # for retry with variadic DEL/RPUSH, one round trip
+        pipe = r.pipeline(transaction=False)
+        for i in range(0, len(keys), REDIS_BATCH_SIZE):
+            pipe.delete(*keys[i:i + REDIS_BATCH_SIZE])
+            for entity in to_retry[i:i + REDIS_BATCH_SIZE]:
+                pipe.lrem(FAILURES_RECENT_KEY, 0, entity)
+            pipe.rpush('job:retry', *to_retry[i:i + REDIS_BATCH_SIZE])
+        pipe.execute()
         
         print(f"🔄 Queued {len(to_retry)} entities for retry")
         print(f"   Strategy: {args.strategy}")
@@ -193,21 +218,32 @@ def cmd_retry(args):
 
 def cmd_mcp_server(args):
     """Start MCP server"""
-    from ..interfaces.mcp.server import main as mcp_main
+    from ..mcp.server import main as mcp_main
     mcp_main()
 
 
+def count_entities(entities_file: str) -> int:
+    """Count non-blank lines, scanning bytes (no decoding) in large buffered reads"""
+    with open(entities_file, 'rb', buffering=1 << 20) as f:
+        return sum(1 for line in f if line.strip())
+
+
 def generate_docker_compose(
     workers: int,
     entities_file: str,
     rate_limit: float,
-    validator: str
+    validator: str,
+    total_entities: Optional[int] = None
 ) -> str:
-    """Generate docker-compose.yml for collection"""
+    """
+    Generate docker-compose.yml for collection.
+    
+    Pass total_entities when the entities are already loaded to skip
+    re-reading entities_file just to count them.
+    """
     
     # Calculate ranges
-    with open(entities_file, 'r') as f:
-        total = sum(1 for line in f if line.strip())
+    total = total_entities if total_entities is not None else count_entities(entities_file)
     
     per_worker = total // workers
     
@@ -8,7 +8,6 @@ Allows Claude to orchestrate distributed data collection through conversation.
 "These 12 failed - retry them with a different strategy"
 """
 
-import json
 import asyncio
 import logging
 from typing import Any, Dict, List, Optional
@@ -24,10 +23,24 @@ except ImportError:
     MCP_AVAILABLE = False
     logging.warning("MCP SDK not installed. Install with: pip install mcp")
 
-import redis
+# Optional: libuv-based event loop, cheaper per I/O call than the default loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from ...core import connection, serialization
+from ...core.worker import FAILURES_RECENT_KEY, PROGRESS_KEY
 
 logger = logging.getLogger(__name__)
 
+# Max keys/values per variadic Redis command
+REDIS_BATCH_SIZE = 500
+
+# Health by success-rate band: <60%, 60-80%, >=80%
+_HEALTH = ("critical", "degraded", "healthy")
+
 
 class DonkeyKongMCPServer:
     """
@@ -38,7 +51,10 @@ class DonkeyKongMCPServer:
     
     def __init__(self, redis_url: str = "redis://localhost:6379"):
         self.redis_url = redis_url
-        self.redis = redis.from_url(redis_url)
+        # Async client over a shared pool - handlers run on the event loop, so
+        # blocking calls would stall it, and concurrent tool calls get their own sockets.
+        # Replies come back as str.
+        self.redis = connection.connect_async(redis_url, max_connections=32)
         self.active_jobs: Dict[str, Dict] = {}
         
         if MCP_AVAILABLE:
@@ -48,150 +64,154 @@ class DonkeyKongMCPServer:
     def _register_tools(self):
         """Register MCP tools"""
         
-        @self.server.list_tools()
-        async def list_tools() -> List[Tool]:
-            return [
-                Tool(
-                    name="donkeykong_start",
-                    description="Start a new distributed collection job. Provide a list of entities to collect and optional validation criteria.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "entities": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of entity identifiers to collect (URLs, tickers, IDs, etc.)"
-                            },
-                            "workers": {
-                                "type": "integer",
-                                "default": 10,
-                                "description": "Number of parallel workers"
-                            },
-                            "validation_prompt": {
-                                "type": "string",
-                                "description": "Custom prompt for Kong LLM validation"
-                            },
-                            "rate_limit": {
-                                "type": "number",
-                                "default": 2.0,
-                                "description": "Seconds between requests per worker"
-                            }
+        # Tool definitions never change - build them once, list_tools hands out the same list
+        self._tool_list = [
+            Tool(
+                name="donkeykong_start",
+                description="Start a new distributed collection job. Provide a list of entities to collect and optional validation criteria.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "entities": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "List of entity identifiers to collect (URLs, tickers, IDs, etc.)"
                         },
-                        "required": ["entities"]
-                    }
-                ),
-                Tool(
-                    name="donkeykong_status",
-                    description="Get current status of the collection job including progress, success rate, and worker status.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "job_id": {
-                                "type": "string",
-                                "description": "Job ID (optional, uses current job if not specified)"
-                            }
+                        "workers": {
+                            "type": "integer",
+                            "default": 10,
+                            "description": "Number of parallel workers"
+                        },
+                        "validation_prompt": {
+                            "type": "string",
+                            "description": "Custom prompt for Kong LLM validation"
+                        },
+                        "rate_limit": {
+                            "type": "number",
+                            "default": 2.0,
+                            "description": "Seconds between requests per worker"
+                        }
+                    },
+                    "required": ["entities"]
+                }
+            ),
+            Tool(
+                name="donkeykong_status",
+                description="Get current status of the collection job including progress, success rate, and worker status.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "job_id": {
+                            "type": "string",
+                            "description": "Job ID (optional, uses current job if not specified)"
                         }
                     }
-                ),
-                Tool(
-                    name="donkeykong_failures",
-                    description="Get list of failed entities with error details.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "limit": {
-                                "type": "integer",
-                                "default": 20,
-                                "description": "Maximum number of failures to return"
-                            }
+                }
+            ),
+            Tool(
+                name="donkeykong_failures",
+                description="Get list of failed entities with error details.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "limit": {
+                            "type": "integer",
+                            "default": 20,
+                            "description": "Maximum number of failures to return"
                         }
                     }
-                ),
-                Tool(
-                    name="donkeykong_retry",
-                    description="Retry failed entities, optionally with a different strategy.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "entities": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Specific entities to retry (optional, retries all failures if not specified)"
-                            },
-                            "strategy": {
-                                "type": "string",
-                                "enum": ["default", "aggressive", "conservative"],
-                                "default": "default",
-                                "description": "Retry strategy - aggressive has shorter delays, conservative has longer"
-                            },
-                            "new_validation_prompt": {
-                                "type": "string",
-                                "description": "New validation prompt for Kong (optional)"
-                            }
+                }
+            ),
+            Tool(
+                name="donkeykong_retry",
+                description="Retry failed entities, optionally with a different strategy.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "entities": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Specific entities to retry (optional, retries all failures if not specified)"
+                        },
+                        "strategy": {
+                            "type": "string",
+                            "enum": ["default", "aggressive", "conservative"],
+                            "default": "default",
+                            "description": "Retry strategy - aggressive has shorter delays, conservative has longer"
+                        },
+                        "new_validation_prompt": {
+                            "type": "string",
+                            "description": "New validation prompt for Kong (optional)"
                         }
                     }
-                ),
-                Tool(
-                    name="donkeykong_validate_sample",
-                    description="Manually validate a sample of collected data to check quality.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "sample_size": {
-                                "type": "integer",
-                                "default": 5,
-                                "description": "Number of random entities to validate"
-                            },
-                            "criteria": {
-                                "type": "string",
-                                "description": "What to check for in the validation"
-                            }
+                }
+            ),
+            Tool(
+                name="donkeykong_validate_sample",
+                description="Manually validate a sample of collected data to check quality.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "sample_size": {
+                            "type": "integer",
+                            "default": 5,
+                            "description": "Number of random entities to validate"
+                        },
+                        "criteria": {
+                            "type": "string",
+                            "description": "What to check for in the validation"
                         }
                     }
-                ),
-                Tool(
-                    name="donkeykong_stop",
-                    description="Gracefully stop the current collection job.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "job_id": {
-                                "type": "string",
-                                "description": "Job ID to stop (optional)"
-                            }
+                }
+            ),
+            Tool(
+                name="donkeykong_stop",
+                description="Gracefully stop the current collection job.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "job_id": {
+                            "type": "string",
+                            "description": "Job ID to stop (optional)"
                         }
                     }
-                )
-            ]
+                }
+            )
+        ]
+        
+        # Tool name -> handler, dispatched by a single dict lookup
+        self._handlers = {
+            "donkeykong_start": self._start_collection,
+            "donkeykong_status": self._get_status,
+            "donkeykong_failures": self._get_failures,
+            "donkeykong_retry": self._retry_failures,
+            "donkeykong_validate_sample": self._validate_sample,
+            "donkeykong_stop": self._stop_collection,
+        }
+        
+        @self.server.list_tools()
+        async def list_tools() -> List[Tool]:
+            return self._tool_list
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             try:
-                if name == "donkeykong_start":
-                    result = await self._start_collection(arguments)
-                elif name == "donkeykong_status":
-                    result = await self._get_status(arguments)
-                elif name == "donkeykong_failures":
-                    result = await self._get_failures(arguments)
-                elif name == "donkeykong_retry":
-                    result = await self._retry_failures(arguments)
-                elif name == "donkeykong_validate_sample":
-                    result = await self._validate_sample(arguments)
-                elif name == "donkeykong_stop":
-                    result = await self._stop_collection(arguments)
+                handler = self._handlers.get(name)
+                if handler is not None:
+                    result = await handler(arguments)
                 else:
                     result = {"error": f"Unknown tool: {name}"}
                 
                 return [TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2, default=str)
+                    text=serialization.dumps(result, indent=True).decode()
                 )]
                 
             except Exception as e:
                 logger.error(f"Tool {name} failed: {e}")
                 return [TextContent(
                     type="text",
-                    text=json.dumps({"error": str(e)})
+                    text=serialization.dumps({"error": str(e)}).decode()
                 )]
     
     async def _start_collection(self, args: Dict) -> Dict:
@@ -204,36 +224,40 @@ class DonkeyKongMCPServer:
         if not entities:
             return {"error": "No entities provided"}
         
-        job_id = f"job_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        job_id = f"job_{now.strftime('%Y%m%d_%H%M%S_%f')}"
         
-        # Store job config
+        # Store job config - the entities themselves live only in the job:entities list
         job_config = {
             'job_id': job_id,
-            'entities': entities,
+            'entities_count': len(entities),
             'workers': workers,
             'validation_prompt': validation_prompt,
             'rate_limit': rate_limit,
             'status': 'starting',
-            'created_at': datetime.now().isoformat()
+            'created_at': now.isoformat()
         }
         
-        self.redis.hset(f'job:{job_id}', mapping={
-            k: json.dumps(v) if isinstance(v, (list, dict)) else str(v) 
+        # Job config, counter reset and entity queue land atomically in one round trip
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(f'job:{job_id}', mapping={
+            k: serialization.dumps(v).decode() if isinstance(v, (list, dict)) else str(v) 
             for k, v in job_config.items()
         })
         
         # Reset progress counters
-        self.redis.delete('collection:progress')
-        self.redis.hset('collection:progress', mapping={
+        pipe.delete(PROGRESS_KEY)
+        pipe.hset(PROGRESS_KEY, mapping={
             'total_processed': 0,
             'total_successful': 0,
             'total_failed': 0
         })
         
-        # Store entities for workers
-        self.redis.delete('job:entities')
-        for entity in entities:
-            self.redis.rpush('job:entities', entity)
+        # Store entities for workers - variadic RPUSH, chunked to bound command size
+        pipe.delete('job:entities')
+        for start in range(0, len(entities), REDIS_BATCH_SIZE):
+            pipe.rpush('job:entities', *entities[start:start + REDIS_BATCH_SIZE])
+        await pipe.execute()
         
         self.active_jobs[job_id] = job_config
         
@@ -254,27 +278,31 @@ class DonkeyKongMCPServer:
     
     async def _get_status(self, args: Dict) -> Dict:
         """Get current job status"""
-        progress = self.redis.hgetall('collection:progress')
+        # Probe as many workers as the job was started with (10 if unknown)
+        job = self.active_jobs.get(args.get('job_id')) or \
+            next(reversed(self.active_jobs.values()), {})
+        worker_ids = range(1, int(job.get('workers', 10)) + 1)
         
-        def decode(val):
-            if isinstance(val, bytes):
-                return val.decode()
-            return val
+        # Progress + every worker hash in one round trip
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(PROGRESS_KEY)
+        for i in worker_ids:
+            pipe.hgetall(f'worker:{i}:stats')
+        progress, *all_worker_stats = await pipe.execute()
         
-        total_processed = int(decode(progress.get(b'total_processed', 0)) or 0)
-        total_successful = int(decode(progress.get(b'total_successful', 0)) or 0)
-        total_failed = int(decode(progress.get(b'total_failed', 0)) or 0)
+        total_processed = int(progress.get('total_processed', 0) or 0)
+        total_successful = int(progress.get('total_successful', 0) or 0)
+        total_failed = int(progress.get('total_failed', 0) or 0)
         
         # Get worker stats
         worker_statuses = []
-        for i in range(1, 11):  # Check up to 10 workers
-            stats = self.redis.hgetall(f'worker:{i}:stats')
+        for i, stats in zip(worker_ids, all_worker_stats):
             if stats:
                 worker_statuses.append({
                     'worker_id': i,
-                    'status': decode(stats.get(b'status', b'unknown')),
-                    'processed': decode(stats.get(b'entities_processed', b'0')),
-                    'current': decode(stats.get(b'current_entity', b'-'))
+                    'status': stats.get('status', 'unknown'),
+                    'processed': stats.get('entities_processed', '0'),
+                    'current': stats.get('current_entity', '-')
                 })
         
         success_rate = (total_successful / max(total_processed, 1)) * 100
@@ -301,7 +329,7 @@ class DonkeyKongMCPServer:
                 "active": active_workers,
                 "details": worker_statuses
             },
-            "health": "healthy" if success_rate >= 80 else "degraded" if success_rate >= 60 else "critical"
+            "health": _HEALTH[(success_rate >= 60) + (success_rate >= 80)]
         }
     
     async def _get_failures(self, args: Dict) -> Dict:
@@ -309,18 +337,24 @@ class DonkeyKongMCPServer:
         limit = args.get('limit', 20)
         failures = []
         
-        for key in self.redis.scan_iter('failures:*'):
-            if len(failures) >= limit:
+        # Large COUNT hint so one SCAN batch usually covers the limit
+        keys = []
+        async for key in self.redis.scan_iter('failures:*', count=max(limit * 2, REDIS_BATCH_SIZE)):
+            if len(keys) >= limit:
                 break
-                
-            failure_data = self.redis.hgetall(key)
-            entity = key.decode().split(':')[1] if isinstance(key, bytes) else key.split(':')[1]
-            
+            keys.append(key)
+        
+        # Fetch every hash in one round trip instead of one per failure
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.hgetall(key)
+        
+        for key, failure_data in zip(keys, await pipe.execute()):
             failures.append({
-                'entity': entity,
-                'error': failure_data.get(b'error', b'').decode() if b'error' in failure_data else '',
-                'worker_id': failure_data.get(b'worker_id', b'').decode() if b'worker_id' in failure_data else '',
-                'timestamp': failure_data.get(b'timestamp', b'').decode() if b'timestamp' in failure_data else ''
+                'entity': key.split(':', 1)[1],
+                'error': failure_data.get('error', ''),
+                'worker_id': failure_data.get('worker_id', ''),
+                'timestamp': failure_data.get('timestamp', '')
             })
         
         # Group by error type
@@ -348,20 +382,22 @@ class DonkeyKongMCPServer:
             to_retry = specific_entities
         else:
             to_retry = []
-            for key in self.redis.scan_iter('failures:*'):
-                entity = key.decode().split(':')[1] if isinstance(key, bytes) else key.split(':')[1]
-                to_retry.append(entity)
+            async for key in self.redis.scan_iter('failures:*', count=1000):
+                to_retry.append(key.split(':', 1)[1])
         
         if not to_retry:
             return {"message": "No failures to retry"}
         
-        # Clear failure records for entities being retried
-        for entity in to_retry:
-            self.redis.delete(f'failures:{entity}')
-        
-        # Queue for retry
-        for entity in to_retry:
-            self.redis.rpush('job:retry', entity)
+        # Clear failure records (and their recent-failures index entries)
+        # and queue for retry in one round trip
+        pipe = self.redis.pipeline(transaction=False)
+        for start in range(0, len(to_retry), REDIS_BATCH_SIZE):
+            chunk = to_retry[start:start + REDIS_BATCH_SIZE]
+            pipe.delete(*(f'failures:{entity}' for entity in chunk))
+            for entity in chunk:
+                pipe.lrem(FAILURES_RECENT_KEY, 0, entity)
+            pipe.rpush('job:retry', *chunk)
+        await pipe.execute()
         
         rate_limits = {
             'default': 2.0,
@@ -394,7 +430,7 @@ class DonkeyKongMCPServer:
     async def _stop_collection(self, args: Dict) -> Dict:
         """Stop collection gracefully"""
         # Signal workers to stop
-        self.redis.set('job:stop_signal', '1')
+        await self.redis.set('job:stop_signal', '1')
         
         return {
             "status": "stopping",
@@ -416,10 +452,11 @@ class DonkeyKongMCPServer:
 
 def main():
     """Entry point for MCP server"""
-    import asyncio
-    
     server = DonkeyKongMCPServer()
-    asyncio.run(server.run())
+    if UVLOOP_AVAILABLE:
+        uvloop.run(server.run())
+    else:
+        asyncio.run(server.run())
 
 
 if __name__ == "__main__":
@@ -19,16 +19,64 @@ Usage:
 """
 
 import os
-import json
+import queue
+import asyncio
+import functools
+import threading
 import subprocess
 import tempfile
-from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-from ..core.worker import DonkeyWorker, WorkerConfig, CollectionResult
-from ..core.monitor import DonkeyMonitor, MonitorConfig
-from ..kong.validator import OllamaValidator, SchemaValidator, BaseValidator
+from ...core import serialization
+from ...core.worker import DonkeyWorker, WorkerConfig, CollectionResult
+from ...core.monitor import DonkeyMonitor, MonitorConfig
+from ...kong.validator import OllamaValidator, SchemaValidator, BaseValidator
+
+# Optional: concurrent in-process URL fetching
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Local runs append one JSON record per entity here (inside data_dir)
+RESULTS_FILE = 'results.jsonl'
+
+# Entities joined per write when handing the entity list to Docker workers
+ENTITY_WRITE_CHUNK = 10000
+
+# Compose layout is fixed - build the templates once, interpolate per worker
+_COMPOSE_TEMPLATE = """version: '3.8'
+
+services:
+{services}
+"""
+
+_REDIS_SERVICE = """
+  redis:
+    image: redis:7-alpine
+    ports:
+      - "6379:6379"
+"""
+
+_WORKER_SERVICE = """
+  worker-{i}:
+    build: .
+    environment:
+      - WORKER_ID={i}
+      - START_INDEX={start}
+      - END_INDEX={end}
+      - ENTITIES_FILE=/data/entities_w{i}.txt
+      - REDIS_URL=redis://redis:6379
+      - RATE_LIMIT={rate_limit}
+    volumes:
+      - ./:/data
+    depends_on:
+      - redis
+"""
 
 
 @dataclass
@@ -40,6 +88,7 @@ class PipelineConfig:
     data_dir: str = "./data"
     redis_url: str = "redis://localhost:6379"
     use_docker: bool = True
+    executor: str = "thread"  # Local runs: "thread" (I/O-bound) or "process" (CPU-bound)
 
 
 class Pipeline:
@@ -116,39 +165,48 @@ class Pipeline:
         else:
             return self._run_local()
     
+    async def run_async(self, blocking: bool = True) -> Dict[str, Any]:
+        """
+        Run the pipeline from inside an event loop without blocking it.
+        
+        Same arguments and result as run(). docker-compose runs as an asyncio
+        subprocess; file writing and local collection run in threads.
+        """
+        if not self.config.use_docker:
+            return await asyncio.to_thread(self._run_local)
+        
+        cmd, compose_file = await asyncio.to_thread(self._prepare_docker, blocking)
+        process = await asyncio.create_subprocess_exec(*cmd, cwd=self.config.data_dir)
+        await process.wait()
+        return self._docker_summary(compose_file, blocking)
+    
     def _run_local(self) -> Dict[str, Any]:
-        """Run collection locally (single process)"""
-        results = []
+        """Run collection locally, across config.workers threads (or processes)"""
+        if self.config.executor == "process":
+            # Ships self to the pool - collector and validator must be picklable
+            executor = ProcessPoolExecutor(max_workers=self.config.workers)
+            chunksize = max(1, len(self.entities) // (self.config.workers * 4))
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.config.workers)
+            chunksize = 1
         
-        for entity in self.entities:
-            try:
-                data = self.collect(entity)
-                validation = self.validate(entity, data)
-                
-                result = CollectionResult(
-                    entity_id=entity,
-                    success=validation.get('valid', False),
-                    data=data,
-                    quality_score=validation.get('quality_score', 0),
-                    validation_result=validation
-                )
-                results.append(result)
-                
-                # Save to file
-                filename = Path(self.config.data_dir) / f"{entity}_data.json"
-                with open(filename, 'w') as f:
-                    json.dump({
-                        'entity': entity,
-                        'data': data,
-                        'validation': validation
-                    }, f, indent=2, default=str)
-                    
-            except Exception as e:
-                results.append(CollectionResult(
-                    entity_id=entity,
-                    success=False,
-                    error=str(e)
-                ))
+        # Single writer thread appends records to one JSONL file as results arrive
+        records: queue.Queue = queue.Queue()
+        writer = threading.Thread(target=self._write_records, args=(records,), daemon=True)
+        writer.start()
+        
+        results = []
+        try:
+            with executor:
+                for result, record in executor.map(
+                    self._collect_and_validate, self.entities, chunksize=chunksize
+                ):
+                    results.append(result)
+                    if record is not None:
+                        records.put(record)
+        finally:
+            records.put(None)
+            writer.join()
         
         successful = sum(1 for r in results if r.success)
         
@@ -159,13 +217,53 @@ class Pipeline:
             'success_rate': (successful / len(results)) * 100 if results else 0
         }
     
+    def _collect_and_validate(self, entity: str) -> Tuple[CollectionResult, Optional[bytes]]:
+        """Collect and validate a single entity, returning its result and encoded record"""
+        try:
+            data = self.collect(entity)
+            validation = self.validate(entity, data)
+            
+            result = CollectionResult(
+                entity_id=entity,
+                success=validation.get('valid', False),
+                data=data,
+                quality_score=validation.get('quality_score', 0),
+                validation_result=validation
+            )
+            # Compact encoding, done here so pool workers share the cost
+            record = serialization.dumps({'entity': entity, 'data': data, 'validation': validation})
+            return result, record
+        
+        except Exception as e:
+            return CollectionResult(
+                entity_id=entity,
+                success=False,
+                error=str(e)
+            ), None
+    
+    def _write_records(self, records: queue.Queue):
+        """Append queued records to the results file until a None sentinel arrives"""
+        with open(Path(self.config.data_dir) / RESULTS_FILE, 'ab') as f:
+            while True:
+                record = records.get()
+                if record is None:
+                    return
+                f.write(record + b'\n')
+    
     def _run_docker(self, blocking: bool) -> Dict[str, Any]:
         """Run collection with Docker workers"""
-        # Write entities to temp file
-        entities_file = Path(self.config.data_dir) / 'entities.txt'
-        with open(entities_file, 'w') as f:
-            for entity in self.entities:
-                f.write(f"{entity}\n")
+        cmd, compose_file = self._prepare_docker(blocking)
+        subprocess.run(cmd, cwd=self.config.data_dir)
+        return self._docker_summary(compose_file, blocking)
+    
+    def _prepare_docker(self, blocking: bool) -> Tuple[List[str], Path]:
+        """Write entity and compose files, returning the docker-compose command to run"""
+        # Write entities to temp file, plus one partition per worker so each
+        # worker reads only its own share instead of scanning the full list
+        data_dir = Path(self.config.data_dir)
+        _write_entities(data_dir / 'entities.txt', self.entities)
+        for i, start, end in _worker_slices(len(self.entities), self.config.workers):
+            _write_entities(data_dir / f'entities_w{i}.txt', self.entities[start:end])
         
         # Generate docker-compose
         compose = self._generate_compose()
@@ -178,8 +276,10 @@ class Pipeline:
         if not blocking:
             cmd.append('-d')
         
-        subprocess.run(cmd, cwd=self.config.data_dir)
-        
+        return cmd, compose_file
+    
+    def _docker_summary(self, compose_file: Path, blocking: bool) -> Dict[str, Any]:
+        """Summary returned once docker-compose exits"""
         return {
             'status': 'started' if not blocking else 'completed',
             'entities': len(self.entities),
@@ -189,61 +289,63 @@ class Pipeline:
     
     def _generate_compose(self) -> str:
         """Generate docker-compose.yml"""
-        per_worker = len(self.entities) // self.config.workers
-        
-        services = []
-        
-        # Redis
-        services.append("""
-  redis:
-    image: redis:7-alpine
-    ports:
-      - "6379:6379"
-""")
-        
-        # Workers
-        for i in range(1, self.config.workers + 1):
-            start = (i - 1) * per_worker
-            end = start + per_worker if i < self.config.workers else len(self.entities)
-            
-            services.append(f"""
-  worker-{i}:
-    build: .
-    environment:
-      - WORKER_ID={i}
-      - START_INDEX={start}
-      - END_INDEX={end}
-      - REDIS_URL=redis://redis:6379
-      - RATE_LIMIT={self.config.rate_limit}
-    volumes:
-      - ./:/data
-    depends_on:
-      - redis
-""")
-        
-        return f"""version: '3.8'
-
-services:
-{''.join(services)}
-"""
+        return _compose_body(len(self.entities), self.config.workers, self.config.rate_limit)
     
-    def get_results(self) -> List[Dict]:
-        """Get collected results from data directory"""
-        results = []
+    def get_results(self) -> Iterator[Dict]:
+        """
+        Stream collected results from the data directory.
         
-        for file in Path(self.config.data_dir).glob('*_data.json'):
-            with open(file, 'r') as f:
-                results.append(json.load(f))
+        Yields local-run records from results.jsonl (oldest first), then any
+        per-entity files written by Docker workers.
+        """
+        results_file = Path(self.config.data_dir) / RESULTS_FILE
+        if results_file.exists():
+            with open(results_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield serialization.loads(line)
         
-        return results
+        for file in Path(self.config.data_dir).glob('*_data.json'):
+            with open(file, 'rb') as f:
+                yield serialization.loads(f.read())
     
     def get_failures(self) -> List[str]:
-        """Get list of failed entities"""
-        results = self.get_results()
-        return [
-            r['entity'] for r in results 
-            if not r.get('validation', {}).get('valid', False)
-        ]
+        """Get list of failed entities (an entity's latest result wins)"""
+        valid = {}
+        for r in self.get_results():
+            if 'entity' in r:
+                valid[r['entity']] = r.get('validation', {}).get('valid', False)
+            else:
+                # Docker worker record (see DonkeyWorker._save_result)
+                valid[r['entity_id']] = r.get('success', False)
+        return [entity for entity, ok in valid.items() if not ok]
+
+
+@functools.lru_cache(maxsize=32)
+def _compose_body(n_entities: int, workers: int, rate_limit: float) -> str:
+    """Render docker-compose.yml for n_entities split across workers (last takes the rest)"""
+    return _COMPOSE_TEMPLATE.format(services=''.join([
+        _REDIS_SERVICE,
+        *(_WORKER_SERVICE.format(i=i, start=start, end=end, rate_limit=rate_limit)
+          for i, start, end in _worker_slices(n_entities, workers))
+    ]))
+
+
+def _worker_slices(n_entities: int, workers: int) -> List[Tuple[int, int, int]]:
+    """(worker_id, start, end) for each worker - equal shares, last takes the rest"""
+    per_worker = n_entities // workers
+    return [
+        (i, (i - 1) * per_worker, i * per_worker if i < workers else n_entities)
+        for i in range(1, workers + 1)
+    ]
+
+
+def _write_entities(path: Path, entities: List[str]):
+    """Write entities one per line, one bulk write per chunk"""
+    with open(path, 'wb') as f:
+        for start in range(0, len(entities), ENTITY_WRITE_CHUNK):
+            chunk = entities[start:start + ENTITY_WRITE_CHUNK]
+            f.write(('\n'.join(chunk) + '\n').encode('utf-8'))
 
 
 # Convenience functions
@@ -276,18 +378,62 @@ def collect(
     return pipeline.run()
 
 
+async def _fetch_url_async(url: str, session, sem: asyncio.BoundedSemaphore) -> Dict:
+    """Fetch one URL on a shared session, in the same shape as the sync fetcher"""
+    async with sem:
+        try:
+            async with session.get(url) as response:
+                text = await response.text()
+                return {
+                    'url': url,
+                    'status_code': response.status,
+                    'content_length': len(text),
+                    'content': text[:1000]  # First 1000 chars
+                }
+        except Exception as e:
+            return {'url': url, 'error': str(e)}
+
+
+async def _fetch_urls_async(urls: List[str], concurrency: int) -> Dict[str, Dict]:
+    """Fetch all URLs concurrently over one pooled session"""
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency)
+    sem = asyncio.BoundedSemaphore(concurrency)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=aiohttp.ClientTimeout(total=30)
+    ) as session:
+        results = await asyncio.gather(*(_fetch_url_async(u, session, sem) for u in urls))
+    return dict(zip(urls, results))
+
+
+def _event_loop_running() -> bool:
+    """True when called from inside a running event loop, where asyncio.run() fails"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 def collect_urls(
     urls: List[str],
     validator: Optional[BaseValidator] = None,
-    workers: int = 10
+    workers: int = 10,
+    concurrency: int = 64,
+    **kwargs
 ) -> Dict[str, Any]:
     """
     Convenience function for URL collection.
     
+    When running in-process (use_docker=False) with aiohttp installed and no
+    event loop already running in this thread, all URLs are fetched
+    concurrently up front and validated as they are replayed. Called from
+    async code (MCP server, Jupyter), it fetches on the worker threads instead.
+    
     Args:
         urls: List of URLs to fetch
         validator: Optional Kong validator for content validation
         workers: Number of parallel workers
+        concurrency: Max in-flight requests for in-process aiohttp fetching
     """
     import requests
     
@@ -303,4 +449,9 @@ def collect_urls(
         except Exception as e:
             return {'url': url, 'error': str(e)}
     
-    return collect(urls, fetch_url, validator, workers)
+    collector = fetch_url
+    if AIOHTTP_AVAILABLE and not kwargs.get('use_docker', True) and not _event_loop_running():
+        fetched = asyncio.run(_fetch_urls_async(urls, concurrency))
+        collector = fetched.__getitem__
+    
+    return collect(urls, collector, validator, workers, **kwargs)
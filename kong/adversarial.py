@@ -10,23 +10,251 @@ After expensive AI (Claude) produces analysis, Kong validates it for:
 This implements the "cheap intelligence challenges expensive intelligence" pattern.
 """
 
-import json
-from typing import Dict, List, Tuple, Optional, Any
+import hashlib
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
+from enum import IntFlag
 
+from ..core import serialization
 
-@dataclass
+# Optional: match every semantic term in one pass over the analysis text
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional: compile the scoring arithmetic to machine code
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# batch_validate([]) summary - copied per call, never handed out directly
+_EMPTY_BATCH_SUMMARY = {
+    'total_validated': 0,
+    'passed': 0,
+    'needs_rerun': 0,
+    'avg_confidence': 0,
+    'min_confidence': 0,
+    'max_confidence': 0,
+    'rerun_items': []
+}
+
+class Action(IntFlag):
+    """Recommended follow-up actions, combinable as a bitmask"""
+    APPROVED = 1
+    REVIEW = 2
+    RERUN = 4
+    ADD_DATA = 8
+    ESCALATE = 16
+    DEEP_DIVE = 32
+
+
+# Message for each action, in the order they are recommended
+_ACTION_MESSAGES = {
+    Action.ADD_DATA: "ADD_DATA: Collect missing data sources before reanalysis",
+    Action.REVIEW: "REVIEW: Manual review needed for inconsistencies",
+    Action.RERUN: "RERUN: Conclusions may not follow from evidence",
+    Action.ESCALATE: "ESCALATE: Too many issues for automated resolution",
+    Action.DEEP_DIVE: "DEEP_DIVE: Many unanswered questions require investigation",
+    Action.APPROVED: "APPROVED: Analysis passes adversarial validation"
+}
+
+_MESSAGE_ACTIONS = {message: action for action, message in _ACTION_MESSAGES.items()}
+
+# Recommendation messages for every action mask - built once, shared by every result
+_RECOMMENDATIONS = tuple(
+    tuple(message for action, message in _ACTION_MESSAGES.items() if action & mask)
+    for mask in range(1 << len(Action))
+)
+
+# Joins section keys for substring search - mapped terms never contain it
+_KEY_SEPARATOR = '\x00'
+
+# Per-instance __dict__ dropped where dataclasses support it (3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _walk(obj) -> Tuple[str, Set[str]]:
+    """
+    Flatten an analysis to searchable lowercase text and collect its section keys.
+    
+    One iterative pre-order pass: dict keys and scalar values become space
+    separated text (nesting past depth 10 is stringified whole), and the keys
+    of dicts nested only in dicts, up to depth 5, are gathered lowercased.
+    Only containers get a stack frame - scalars are emitted in place.
+    """
+    parts: List[str] = []
+    keys: Set[str] = set()
+    append = parts.append
+    
+    # (children iterator, is dict, depth, collect keys, reached through dicts only)
+    stack = []
+    if isinstance(obj, dict) and obj:
+        stack.append((iter(obj.items()), True, 0, True, True))
+    elif isinstance(obj, list) and obj:
+        stack.append((iter(obj), False, 0, False, False))
+    elif isinstance(obj, (dict, list)):
+        append('')  # Empty containers still take a slot in the text
+    else:
+        append(str(obj) if obj else '')
+    
+    while stack:
+        children, is_dict, depth, collect, in_dicts = stack[-1]
+        for child in children:
+            if is_dict:
+                key = str(child[0])
+                append(key)
+                if collect:
+                    keys.add(key.lower())
+                child = child[1]
+                child_in_dicts = in_dicts
+            else:
+                child_in_dicts = False
+            
+            child_depth = depth + 1
+            if child_depth > 10:  # Prevent runaway nesting
+                append(str(child))
+            elif isinstance(child, dict):
+                if child:
+                    stack.append((iter(child.items()), True, child_depth,
+                                  child_in_dicts and child_depth <= 5, child_in_dicts))
+                    break  # Descend; this frame resumes from its iterator afterwards
+                append('')
+            elif isinstance(child, list):
+                if child:
+                    stack.append((iter(child), False, child_depth, False, False))
+                    break
+                append('')
+            else:
+                append(str(child) if child else '')
+        else:
+            stack.pop()
+    
+    return ' '.join(parts).lower(), keys
+
+
+def _combine_scores(
+    completeness: float,
+    consistency: float,
+    logic: float,
+    completeness_weight: float,
+    consistency_weight: float,
+    logic_weight: float,
+    issue_count: int
+) -> float:
+    """Weighted overall confidence less the issue penalty (5% per issue, capped at 30%)"""
+    overall = (
+        completeness * completeness_weight +
+        consistency * consistency_weight +
+        logic * logic_weight
+    )
+    return max(0.0, overall - min(issue_count * 0.05, 0.3))
+
+
+if NUMBA_AVAILABLE:
+    # Compiled at import for a fixed signature and cached on disk (__pycache__, or
+    # NUMBA_CACHE_DIR - point it at a baked-in directory for read-only installs),
+    # so later processes load machine code instead of recompiling.
+    # No fastmath - results must match the interpreted arithmetic exactly.
+    try:
+        _combine_scores = numba.njit(
+            'float64(float64, float64, float64, float64, float64, float64, int64)', cache=True
+        )(_combine_scores)
+    except Exception:
+        # Unloadable cache (stale, or written when imported under another package
+        # name) - keep the interpreted function rather than failing the import
+        pass
+
+
+def _build_term_automaton(terms: Iterable[str]):
+    """Aho-Corasick automaton over terms (None without pyahocorasick)"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_terms(automaton, text: str):
+    """
+    Automaton terms occurring in text, as a container for `in` tests.
+    
+    One automaton pass when pyahocorasick is installed; otherwise the text
+    itself, so membership falls back to plain substring search.
+    Terms outside the automaton must be tested against the text directly.
+    """
+    if automaton is None:
+        return text
+    return {term for _, term in automaton.iter(text)}
+
+
+@dataclass(**_SLOTS)
+class _AnalysisContext:
+    """Views of an analysis shared by all checks - derived once per validate()"""
+    text: str  # Flattened, lowercased analysis
+    keys: Set[str]  # Lowercased keys of nested sections
+    confidence: Any
+    score: Any
+    findings: Any
+    findings_text: str  # Flattened, lowercased findings
+    recommendations: Any
+    
+    @classmethod
+    def from_analysis(cls, analysis: Dict[str, Any]) -> '_AnalysisContext':
+        text, keys = _walk(analysis)
+        findings = analysis.get('findings', []) or analysis.get('key_findings', [])
+        return cls(
+            text=text,
+            keys=keys,
+            confidence=analysis.get('confidence', 0),
+            score=analysis.get('score') or analysis.get('quality_score', 0),
+            findings=findings,
+            findings_text=' '.join(str(f) for f in findings).lower(),
+            recommendations=analysis.get('recommendations', [])
+        )
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ValidationResult:
-    """Result of adversarial validation"""
+    """
+    Result of adversarial validation.
+    
+    Immutable, lists included (stored as tuples) - cached results are
+    shared between callers.
+    """
     overall_confidence: float
     completeness_score: float
     consistency_score: float
     logic_score: float
-    issues_found: List[str]
-    adversarial_questions: List[str]
-    recommended_actions: List[str]
+    issues_found: Tuple[str, ...]
+    adversarial_questions: Tuple[str, ...]
+    recommended_actions: Tuple[str, ...]
     should_rerun: bool
+    
+    def __post_init__(self):
+        # Frozen - bypass __setattr__ to store the sequences as tuples
+        for name in ('issues_found', 'adversarial_questions', 'recommended_actions'):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+    
+    @property
+    def actions(self) -> Action:
+        """Recommended actions as a bitmask, e.g. `result.actions & Action.RERUN`"""
+        mask = Action(0)
+        for message in self.recommended_actions:
+            mask |= _MESSAGE_ACTIONS.get(message, 0)
+        return mask
 
 
 class AdversarialValidator:
@@ -41,74 +269,176 @@ class AdversarialValidator:
     This minimizes expensive API calls while maximizing quality.
     """
     
+    # Related terms that show a common data source was used (lowercase)
+    SEMANTIC_MAPPINGS = {
+        'earnings': ('earnings', 'eps', 'revenue', 'quarterly', 'q1', 'q2', 'q3', 'q4', 
+                     'profit', 'income', 'financial'),
+        'news': ('news', 'sentiment', 'media', 'coverage', 'article', 'press'),
+        'analyst': ('analyst', 'rating', 'target', 'consensus', 'upgrade', 'downgrade',
+                    'buy', 'sell', 'hold', 'overweight', 'underweight'),
+        'insider': ('insider', 'transaction', 'executive', 'director', 'officer',
+                    'purchase', 'sale', 'filing'),
+        'sec': ('sec', 'filing', '10-k', '10-q', '8-k', 'proxy', 'edgar'),
+        'filings': ('filing', 'regulatory', 'disclosure', 'sec', 'annual', 'quarterly')
+    }
+    _TERM_AUTOMATON = _build_term_automaton(
+        term for terms in SEMANTIC_MAPPINGS.values() for term in terms
+    )
+    
+    # Sources whose absence from an analysis is flagged as an issue
+    CRITICAL_SOURCES = frozenset({'earnings', 'filings', 'analyst', 'news', 'insider', 'sec'})
+    _CRITICAL_RE = re.compile('|'.join(map(re.escape, sorted(CRITICAL_SOURCES))))
+    
+    # raw_data keys describing the collection rather than holding source data
+    METADATA_KEYS = frozenset({
+        'data_quality_score', 'sources_failed', 'sources_successful',
+        'collection_timestamp', 'ticker', 'entity_id'
+    })
+    
+    # Finding terms that pull in opposite directions
+    CONTRADICTION_PAIRS = (
+        ('positive', 'negative'),
+        ('increasing', 'decreasing'),
+        ('strong', 'weak'),
+        ('improving', 'declining')
+    )
+    _CONTRADICTION_AUTOMATON = _build_term_automaton(
+        term for pair in CONTRADICTION_PAIRS for term in pair
+    )
+    
+    # Questions every analysis should answer, whatever the data
+    _FIXED_QUESTIONS = (
+        # Temporal
+        "Is this analysis based on current data or historical trends?",
+        "How might this conclusion change in 3-6 months?",
+        # Scope
+        "What factors outside the available data could affect this conclusion?",
+        "How does this compare to industry peers/benchmarks?",
+    )
+    
+    # Batches at least this long are spread over processes - below it, pool startup dominates
+    PARALLEL_MIN_BATCH = 1000
+    
     def __init__(
         self,
         completeness_weight: float = 0.4,
         consistency_weight: float = 0.3,
         logic_weight: float = 0.3,
         confidence_threshold: float = 0.7,
-        max_issues_before_rerun: int = 3
+        max_issues_before_rerun: int = 3,
+        max_cache: int = 1024
     ):
         self.completeness_weight = completeness_weight
         self.consistency_weight = consistency_weight
         self.logic_weight = logic_weight
         self.confidence_threshold = confidence_threshold
         self.max_issues_before_rerun = max_issues_before_rerun
+        self.max_cache = max_cache  # Memoized results kept (LRU); 0 disables
+        self._cache: 'OrderedDict[str, ValidationResult]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._expected_fields_cache: Dict[Tuple[str, ...], tuple] = {}
+    
+    def __getstate__(self):
+        # Pickled into worker processes - locks don't pickle, and workers start with an empty cache
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        del state['_cache_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
     
     def validate(
         self,
         entity_id: str,
         analysis: Dict[str, Any],
         raw_data: Dict[str, Any],
-        expected_fields: Optional[List[str]] = None
+        expected_fields: Optional[List[str]] = None,
+        use_cache: bool = True
     ) -> ValidationResult:
         """
         Validate an analysis against the raw data it was based on.
         
+        Results are memoized by content, so replaying an identical
+        (analysis, raw_data, expected_fields) returns the cached result.
+        
         Args:
             entity_id: Identifier for the entity analyzed
             analysis: The AI-generated analysis to validate
             raw_data: The raw data that was provided for analysis
             expected_fields: Fields that should have been analyzed
+            use_cache: Set False to always re-run the checks
             
         Returns:
             ValidationResult with scores and recommendations
         """
-        issues = []
-        adversarial_questions = []
+        if not use_cache or self.max_cache <= 0:
+            return self._validate(analysis, raw_data, expected_fields)
+        
+        key = self._cache_key(analysis, raw_data, expected_fields)
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                return result
+        
+        result = self._validate(analysis, raw_data, expected_fields)
+        with self._cache_lock:
+            self._cache[key] = result
+            while len(self._cache) > self.max_cache:
+                self._cache.popitem(last=False)  # Evict least recently used
+        return result
+    
+    @staticmethod
+    def _cache_key(
+        analysis: Dict[str, Any],
+        raw_data: Dict[str, Any],
+        expected_fields: Optional[List[str]]
+    ) -> str:
+        """Content hash of a validate() call's inputs"""
+        # Key order is kept - it shapes the flattened text, so it is part of the input
+        payload = serialization.dumps([analysis, raw_data, expected_fields])
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _validate(
+        self,
+        analysis: Dict[str, Any],
+        raw_data: Dict[str, Any],
+        expected_fields: Optional[List[str]]
+    ) -> ValidationResult:
+        """Run every check on one analysis (uncached)"""
+        # Walk the analysis once - every check reads from the same views
+        ctx = _AnalysisContext.from_analysis(analysis)
         
         # 1. Completeness Check
         completeness_score, completeness_issues = self._check_completeness(
-            analysis, raw_data, expected_fields
+            ctx, raw_data, expected_fields
         )
-        issues.extend(completeness_issues)
         
         # 2. Consistency Check
         consistency_score, consistency_issues = self._check_consistency(
-            analysis, raw_data
+            ctx, raw_data
         )
-        issues.extend(consistency_issues)
         
         # 3. Logic Check
-        logic_score, logic_issues = self._check_logic(analysis, raw_data)
-        issues.extend(logic_issues)
+        logic_score, logic_issues = self._check_logic(ctx, raw_data)
+        
+        # One exactly-sized list, in check order
+        issues = [*completeness_issues, *consistency_issues, *logic_issues]
         
         # 4. Generate Adversarial Questions
         adversarial_questions = self._generate_adversarial_questions(
             analysis, raw_data, issues
         )
         
-        # Calculate overall confidence
-        overall_confidence = (
-            completeness_score * self.completeness_weight +
-            consistency_score * self.consistency_weight +
-            logic_score * self.logic_weight
+        # Calculate overall confidence, less the issue penalty
+        overall_confidence = _combine_scores(
+            completeness_score, consistency_score, logic_score,
+            self.completeness_weight, self.consistency_weight, self.logic_weight,
+            len(issues)
         )
         
-        # Apply issue penalty
-        issue_penalty = min(len(issues) * 0.05, 0.3)
-        overall_confidence = max(0, overall_confidence - issue_penalty)
-        
         # Determine if rerun is needed
         should_rerun = (
             overall_confidence < self.confidence_threshold or
@@ -137,7 +467,7 @@ class AdversarialValidator:
     
     def _check_completeness(
         self,
-        analysis: Dict,
+        ctx: _AnalysisContext,
         raw_data: Dict,
         expected_fields: Optional[List[str]]
     ) -> Tuple[float, List[str]]:
@@ -152,10 +482,9 @@ class AdversarialValidator:
         
         # Strategy 1: Find all non-empty top-level keys in raw_data
         available_sources = set()
+        metadata_keys = self.METADATA_KEYS
         for key, value in raw_data.items():
-            if value and key not in ('data_quality_score', 'sources_failed', 
-                                      'sources_successful', 'collection_timestamp',
-                                      'ticker', 'entity_id'):
+            if value and key not in metadata_keys:
                 # Check if source has actual data (not just metadata)
                 if isinstance(value, dict):
                     if value.get('success', True) and any(v for k, v in value.items() 
@@ -164,49 +493,27 @@ class AdversarialValidator:
                 elif value:
                     available_sources.add(key)
         
-        # Strategy 2: Build semantic mappings for common sources
-        semantic_mappings = {
-            'earnings': ['earnings', 'eps', 'revenue', 'quarterly', 'q1', 'q2', 'q3', 'q4', 
-                        'profit', 'income', 'financial'],
-            'news': ['news', 'sentiment', 'media', 'coverage', 'article', 'press'],
-            'analyst': ['analyst', 'rating', 'target', 'consensus', 'upgrade', 'downgrade',
-                       'buy', 'sell', 'hold', 'overweight', 'underweight'],
-            'insider': ['insider', 'transaction', 'executive', 'director', 'officer',
-                       'purchase', 'sale', 'filing'],
-            'sec': ['sec', 'filing', '10-k', '10-q', '8-k', 'proxy', 'edgar'],
-            'filings': ['filing', 'regulatory', 'disclosure', 'sec', 'annual', 'quarterly']
-        }
+        # Strategy 2: Semantic mappings for common sources
+        semantic_mappings = self.SEMANTIC_MAPPINGS
         
-        # Convert analysis to searchable string (handles nested structures)
-        def flatten_to_string(obj, depth=0) -> str:
-            if depth > 10:  # Prevent infinite recursion
-                return str(obj)
-            if isinstance(obj, dict):
-                parts = []
-                for k, v in obj.items():
-                    parts.append(str(k))
-                    parts.append(flatten_to_string(v, depth + 1))
-                return ' '.join(parts)
-            elif isinstance(obj, list):
-                return ' '.join(flatten_to_string(item, depth + 1) for item in obj)
-            else:
-                return str(obj) if obj else ''
-        
-        analysis_text = flatten_to_string(analysis).lower()
+        analysis_text = ctx.text
+        terms_present = None  # Mapped terms found in the text - computed on first need
+        lowered_sources = {source: source.lower() for source in available_sources}
+        keys_text = None  # Section keys joined for one C-level search per term - built on first need
         
-        # Strategy 3: Check which sources are referenced
+        # Strategy 3: Check which sources are referenced, cheapest test first
         sources_referenced = set()
-        for source in available_sources:
-            source_lower = source.lower()
-            
+        for source, source_lower in lowered_sources.items():
             # Direct match
             if source_lower in analysis_text:
                 sources_referenced.add(source)
                 continue
             
             # Semantic match - check if any related terms appear
-            related_terms = semantic_mappings.get(source_lower, [source_lower])
-            matches = sum(1 for term in related_terms if term in analysis_text)
+            related_terms = semantic_mappings.get(source_lower, (source_lower,))
+            if terms_present is None:
+                terms_present = _find_terms(self._TERM_AUTOMATON, analysis_text)
+            matches = sum(1 for term in related_terms if term in terms_present)
             
             # Require at least 2 related terms for semantic match (reduces false positives)
             if matches >= 2:
@@ -214,19 +521,18 @@ class AdversarialValidator:
                 continue
             
             # Structural match - check if analysis has a section for this source
-            analysis_keys = set()
-            def collect_keys(obj, depth=0):
-                if depth > 5:
-                    return
-                if isinstance(obj, dict):
-                    for k, v in obj.items():
-                        analysis_keys.add(str(k).lower())
-                        collect_keys(v, depth + 1)
-            collect_keys(analysis)
-            
-            if source_lower in analysis_keys or any(
-                term in key for term in related_terms for key in analysis_keys
-            ):
+            analysis_keys = ctx.keys
+            if source_lower in analysis_keys:
+                sources_referenced.add(source)
+                continue
+            if keys_text is None:
+                keys_text = _KEY_SEPARATOR.join(analysis_keys)
+            if _KEY_SEPARATOR in source_lower:
+                # Could match across joined keys - test them one by one
+                found = any(term in key for term in related_terms for key in analysis_keys)
+            else:
+                found = any(term in keys_text for term in related_terms)
+            if found:
                 sources_referenced.add(source)
         
         # Calculate completeness score
@@ -236,11 +542,10 @@ class AdversarialValidator:
             completeness = 1.0  # No sources to check = complete
         
         # Flag critical missing sources
-        critical_sources = {'earnings', 'filings', 'analyst', 'news', 'insider', 'sec'}
-        for source in available_sources:
-            if source.lower() in critical_sources or any(
-                crit in source.lower() for crit in critical_sources
-            ):
+        # A source is critical if its name contains any critical source name
+        critical_search = self._CRITICAL_RE.search
+        for source, source_lower in lowered_sources.items():
+            if critical_search(source_lower) is not None:
                 if source not in sources_referenced:
                     issues.append(
                         f"Critical data source '{source}' available but not clearly analyzed"
@@ -248,67 +553,87 @@ class AdversarialValidator:
         
         # Check expected fields if provided
         if expected_fields:
-            for field in expected_fields:
-                field_lower = field.lower()
-                # Use same semantic matching for expected fields
-                related = semantic_mappings.get(field_lower, [field_lower])
-                if not any(term in analysis_text for term in related):
+            # Use same semantic matching for expected fields
+            for field, field_lower, related in self._prepare_expected_fields(expected_fields):
+                if related is None:
+                    addressed = field_lower in analysis_text
+                else:
+                    if terms_present is None:
+                        terms_present = _find_terms(self._TERM_AUTOMATON, analysis_text)
+                    addressed = any(term in terms_present for term in related)
+                if not addressed:
                     issues.append(f"Expected field '{field}' not addressed in analysis")
         
         return completeness, issues
     
+    def _prepare_expected_fields(
+        self,
+        expected_fields: List[str]
+    ) -> Tuple[Tuple[str, str, Optional[Tuple[str, ...]]], ...]:
+        """(field, lowercased field, related terms or None) per field - cached per field list"""
+        key = tuple(expected_fields)
+        prepared = self._expected_fields_cache.get(key)
+        if prepared is None:
+            mappings = self.SEMANTIC_MAPPINGS
+            prepared = tuple(
+                (field, field.lower(), mappings.get(field.lower())) for field in key
+            )
+            if len(self._expected_fields_cache) >= 256:
+                self._expected_fields_cache.clear()  # Callers normally reuse a handful of lists
+            self._expected_fields_cache[key] = prepared
+        return prepared
+    
     def _check_consistency(
         self,
-        analysis: Dict,
+        ctx: _AnalysisContext,
         raw_data: Dict
     ) -> Tuple[float, List[str]]:
         """Check if analysis conclusions are internally consistent"""
         issues = []
-        consistency_score = 1.0
         
-        # Extract key metrics from analysis
-        confidence = analysis.get('confidence', 0)
-        score = analysis.get('score') or analysis.get('quality_score', 0)
-        findings = analysis.get('findings', []) or analysis.get('key_findings', [])
+        # Key metrics from analysis
+        confidence = ctx.confidence
+        score = ctx.score
+        findings = ctx.findings
         
         # Extract metrics from raw data
         data_quality = raw_data.get('data_quality_score', 100)
         sources_failed = raw_data.get('sources_failed', [])
         
-        # Consistency checks
+        # Consistency checks - evaluate every condition, then apply the penalties as one product
+        high_confidence = bool(confidence) and confidence > 0.8
         
         # High confidence with low data quality
-        if confidence and confidence > 0.8 and data_quality < 50:
+        low_quality = high_confidence and data_quality < 50
+        # High score with many failed sources
+        many_failed = bool(score) and score > 7 and len(sources_failed) > 2
+        # Few findings but high confidence
+        few_findings = high_confidence and len(findings) < 2
+        
+        if low_quality:
             issues.append(
                 f"High confidence ({confidence:.0%}) despite low data quality ({data_quality}%)"
             )
-            consistency_score *= 0.6
-        
-        # High score with many failed sources
-        if score and score > 7 and len(sources_failed) > 2:
+        if many_failed:
             issues.append(
                 f"High score ({score}) but {len(sources_failed)} data sources failed"
             )
-            consistency_score *= 0.7
-        
-        # Few findings but high confidence
-        if confidence and confidence > 0.8 and len(findings) < 2:
+        if few_findings:
             issues.append(
                 f"High confidence ({confidence:.0%}) but only {len(findings)} findings"
             )
-            consistency_score *= 0.8
-        
-        # Check for contradictions in findings
-        findings_str = ' '.join(str(f) for f in findings).lower()
-        contradiction_pairs = [
-            ('positive', 'negative'),
-            ('increasing', 'decreasing'),
-            ('strong', 'weak'),
-            ('improving', 'declining')
-        ]
-        
-        for pos, neg in contradiction_pairs:
-            if pos in findings_str and neg in findings_str:
+        
+        consistency_score = (
+            (0.6 if low_quality else 1.0) *
+            (0.7 if many_failed else 1.0) *
+            (0.8 if few_findings else 1.0)
+        )
+        
+        # Check for contradictions in findings - one scan for every term
+        findings_terms = _find_terms(self._CONTRADICTION_AUTOMATON, ctx.findings_text)
+        
+        for pos, neg in self.CONTRADICTION_PAIRS:
+            if pos in findings_terms and neg in findings_terms:
                 # This might be legitimate (describing different aspects)
                 # but worth flagging for review
                 issues.append(
@@ -320,47 +645,47 @@ class AdversarialValidator:
     
     def _check_logic(
         self,
-        analysis: Dict,
+        ctx: _AnalysisContext,
         raw_data: Dict
     ) -> Tuple[float, List[str]]:
         """Check if conclusions logically follow from evidence"""
         issues = []
-        logic_score = 1.0
         
         # Get conclusion strength
-        confidence = analysis.get('confidence', 0)
-        score = analysis.get('score') or analysis.get('quality_score', 0)
+        confidence = ctx.confidence
+        score = ctx.score
+        findings = ctx.findings
         
         # Get evidence strength
         sources_successful = raw_data.get('sources_successful', [])
         data_quality = raw_data.get('data_quality_score', 0)
         
-        # Logic check: Strong conclusions need strong evidence
-        if confidence and confidence > 0.9:
-            if len(sources_successful) < 4:
-                issues.append(
-                    f"Very high confidence ({confidence:.0%}) with limited data sources "
-                    f"({len(sources_successful)} successful)"
-                )
-                logic_score *= 0.7
+        recommendations = ctx.recommendations
         
+        # Logic check: Strong conclusions need strong evidence
+        thin_evidence = bool(confidence) and confidence > 0.9 and len(sources_successful) < 4
         # Logic check: Extreme scores need justification
-        if score:
-            if score > 9 or score < 1:
-                findings = analysis.get('findings', []) or analysis.get('key_findings', [])
-                if len(findings) < 3:
-                    issues.append(
-                        f"Extreme score ({score}) without sufficient supporting findings"
-                    )
-                    logic_score *= 0.6
-        
+        unjustified_score = bool(score) and (score > 9 or score < 1) and len(findings) < 3
         # Logic check: Recommendations should match findings
-        recommendations = analysis.get('recommendations', [])
-        findings = analysis.get('findings', []) or analysis.get('key_findings', [])
+        unsupported_recommendations = bool(recommendations) and not findings
         
-        if recommendations and not findings:
+        if thin_evidence:
+            issues.append(
+                f"Very high confidence ({confidence:.0%}) with limited data sources "
+                f"({len(sources_successful)} successful)"
+            )
+        if unjustified_score:
+            issues.append(
+                f"Extreme score ({score}) without sufficient supporting findings"
+            )
+        if unsupported_recommendations:
             issues.append("Recommendations provided without supporting findings")
-            logic_score *= 0.7
+        
+        logic_score = (
+            (0.7 if thin_evidence else 1.0) *
+            (0.6 if unjustified_score else 1.0) *
+            (0.7 if unsupported_recommendations else 1.0)
+        )
         
         return logic_score, issues
     
@@ -386,13 +711,8 @@ class AdversarialValidator:
                 f"Data quality is only {data_quality}% - what are we potentially missing?"
             )
         
-        # Temporal questions
-        questions.append("Is this analysis based on current data or historical trends?")
-        questions.append("How might this conclusion change in 3-6 months?")
-        
-        # Scope questions
-        questions.append("What factors outside the available data could affect this conclusion?")
-        questions.append("How does this compare to industry peers/benchmarks?")
+        # Temporal and scope questions
+        questions.extend(self._FIXED_QUESTIONS)
         
         # Confidence questions
         confidence = analysis.get('confidence', 0)
@@ -401,8 +721,8 @@ class AdversarialValidator:
         elif confidence and confidence < 0.5:
             questions.append("What additional data would increase confidence?")
         
-        # Issue-specific questions
-        if any('contradictory' in issue.lower() for issue in existing_issues):
+        # Issue-specific questions - one lowercase and search over all issues, not one per issue
+        if 'contradictory' in '\n'.join(existing_issues).lower():
             questions.append("Are the contradictions in findings a bug or a feature?")
         
         return questions
@@ -414,70 +734,105 @@ class AdversarialValidator:
         logic: float,
         issues: List[str],
         questions: List[str]
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """Generate actionable recommendations"""
-        recommendations = []
+        mask = 0
         
         if completeness < 0.8:
-            recommendations.append("ADD_DATA: Collect missing data sources before reanalysis")
+            mask |= Action.ADD_DATA
         
         if consistency < 0.7:
-            recommendations.append("REVIEW: Manual review needed for inconsistencies")
+            mask |= Action.REVIEW
         
         if logic < 0.7:
-            recommendations.append("RERUN: Conclusions may not follow from evidence")
+            mask |= Action.RERUN
         
         if len(issues) > 5:
-            recommendations.append("ESCALATE: Too many issues for automated resolution")
+            mask |= Action.ESCALATE
         
         if len(questions) > 4:
-            recommendations.append("DEEP_DIVE: Many unanswered questions require investigation")
-        
-        if not recommendations:
-            recommendations.append("APPROVED: Analysis passes adversarial validation")
+            mask |= Action.DEEP_DIVE
         
-        return recommendations
+        # Messages come from a precomputed table - no per-call string building
+        return _RECOMMENDATIONS[mask or Action.APPROVED]
     
     def batch_validate(
         self,
-        analyses: List[Tuple[str, Dict, Dict]]
+        analyses: List[Tuple[str, Dict, Dict]],
+        workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Validate multiple analyses and return summary.
         
         Args:
             analyses: List of (entity_id, analysis, raw_data) tuples
+            workers: Processes to validate with (default: one per CPU for
+                batches of PARALLEL_MIN_BATCH or more, otherwise in-process)
             
         Returns:
             Summary with overall stats and items needing rerun
         """
-        results = []
+        if not analyses:
+            return {**_EMPTY_BATCH_SUMMARY, 'rerun_items': []}
+        
         needs_rerun = []
+        # Running summary stats - results are consumed as they arrive, never stored
+        total_validated = passed = 0
+        total_confidence = 0.0
+        min_confidence = max_confidence = None
+        
+        if workers is None:
+            workers = (os.cpu_count() or 1) if len(analyses) >= self.PARALLEL_MIN_BATCH else 1
         
-        for entity_id, analysis, raw_data in analyses:
-            result = self.validate(entity_id, analysis, raw_data)
-            results.append((entity_id, result))
+        if workers > 1 and len(analyses) > 1:
+            validated = self._validate_parallel(analyses, workers)
+        else:
+            validated = map(self._validate_item, analyses)
+        
+        for (entity_id, _, _), result in zip(analyses, validated):
+            confidence = result.overall_confidence
+            total_validated += 1
+            total_confidence += confidence
+            if min_confidence is None or confidence < min_confidence:
+                min_confidence = confidence
+            if max_confidence is None or confidence > max_confidence:
+                max_confidence = confidence
             
-            if result.should_rerun:
+            if not result.should_rerun:
+                passed += 1
+            else:
                 needs_rerun.append({
                     'entity_id': entity_id,
                     'confidence': result.overall_confidence,
-                    'issues': result.issues_found,
-                    'recommendations': result.recommended_actions
+                    'issues': list(result.issues_found),
+                    'recommendations': list(result.recommended_actions)
                 })
         
-        # Calculate summary stats
-        confidences = [r.overall_confidence for _, r in results]
-        
         return {
-            'total_validated': len(results),
-            'passed': sum(1 for _, r in results if not r.should_rerun),
+            'total_validated': total_validated,
+            'passed': passed,
             'needs_rerun': len(needs_rerun),
-            'avg_confidence': sum(confidences) / len(confidences) if confidences else 0,
-            'min_confidence': min(confidences) if confidences else 0,
-            'max_confidence': max(confidences) if confidences else 0,
+            'avg_confidence': total_confidence / total_validated if total_validated else 0,
+            'min_confidence': min_confidence if total_validated else 0,
+            'max_confidence': max_confidence if total_validated else 0,
             'rerun_items': needs_rerun
         }
+    
+    def _validate_item(self, item: Tuple[str, Dict, Dict]) -> ValidationResult:
+        """validate() one (entity_id, analysis, raw_data) tuple"""
+        entity_id, analysis, raw_data = item
+        return self.validate(entity_id, analysis, raw_data)
+    
+    def _validate_parallel(
+        self,
+        analyses: List[Tuple[str, Dict, Dict]],
+        workers: int
+    ) -> Iterator[ValidationResult]:
+        """Validate analyses across worker processes, yielding results in input order"""
+        # Ships self to the pool - subclasses must keep their state picklable
+        chunksize = max(1, len(analyses) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(self._validate_item, analyses, chunksize=chunksize)
 
 
 class OllamaAdversarialValidator(AdversarialValidator):
@@ -493,11 +848,19 @@ class OllamaAdversarialValidator(AdversarialValidator):
         base_url: str = "http://localhost:11434",
         **kwargs
     ):
+        # No memo by default - questions are sampled (temperature 0.7) and an outage
+        # falls back to the rule-based ones, neither of which should be replayed
+        kwargs.setdefault('max_cache', 0)
         super().__init__(**kwargs)
         self.model = model
         self.base_url = base_url
         self._client = None
     
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_client'] = None  # Sockets don't pickle - reconnect lazily in the worker
+        return state
+    
     @property
     def client(self):
         if self._client is None:
@@ -525,7 +888,7 @@ class OllamaAdversarialValidator(AdversarialValidator):
             prompt = f"""You are an adversarial reviewer. Given this analysis and data, 
 generate 3 challenging questions that poke holes in the analysis.
 
-Analysis summary: {json.dumps(analysis, indent=2)[:1000]}
+Analysis summary: {serialization.preview(analysis, 1000)}
 
 Data quality: {raw_data.get('data_quality_score', 'unknown')}%
 Sources failed: {raw_data.get('sources_failed', [])}
@@ -4,24 +4,115 @@ Kong - Local LLM Validator for DonkeyKong
 Intelligent data validation using Ollama (Llama, Mistral, Phi, etc.)
 """
 
+import copy
 import json
+import functools
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+from ..core import serialization
+
 logger = logging.getLogger(__name__)
 
+# Per-instance __dict__ dropped where dataclasses support it (3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Characters of the (indented) data JSON shown to the model
+PROMPT_DATA_CHARS = 2000
+
+# Marks the prompt slots once the template's brace escapes have been resolved
+_SLOT_MARK = '\x00'
+
+
+def _compile_prompt(template: str) -> Tuple[List[str], Tuple[Tuple[int, str], ...]]:
+    """
+    Split a str.format prompt template around its {entity}/{data} slots.
+    
+    Returns the parts (literal text at even indices, slot names at odd
+    ones) and the (index, name) of every slot, for filling by join.
+    """
+    filled = template.format(entity=f'{_SLOT_MARK}entity{_SLOT_MARK}',
+                             data=f'{_SLOT_MARK}data{_SLOT_MARK}')
+    parts = filled.split(_SLOT_MARK)
+    return parts, tuple((i, parts[i]) for i in range(1, len(parts), 2))
+
+
+def _json_size_below(data: Dict[str, Any], limit: int) -> Optional[int]:
+    """
+    len(json.dumps(data)) if that is below limit, else None.
+    
+    Serializes one top-level item at a time and stops as soon as the
+    running length reaches limit, instead of encoding the whole payload.
+    """
+    size = 2  # Braces
+    for i, item in enumerate(data.items()):
+        if size >= limit:
+            return None
+        # json.dumps({k: v}) is the item's text plus braces; items are joined by ', '
+        size += len(json.dumps(dict((item,)))) - 2 + (2 if i else 0)
+    return size if size < limit else None
+
+
+class _JsonObjectScanner:
+    """
+    Spots complete top-level JSON objects in text arriving chunk by chunk.
+    
+    Tracks brace depth, skipping braces inside JSON strings, and reports
+    each object's span in the concatenated text as soon as it closes.
+    """
+    
+    def __init__(self):
+        self.offset = 0  # Characters seen in earlier chunks
+        self.start = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Scan the next chunk, yielding (start, end) of every object it closes"""
+        for i, ch in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = self.depth > 0  # Quotes outside an object are prose
+            elif ch == '{':
+                if self.depth == 0:
+                    self.start = self.offset + i
+                self.depth += 1
+            elif ch == '}' and self.depth:
+                self.depth -= 1
+                if self.depth == 0:
+                    yield self.start, self.offset + i + 1
+        self.offset += len(text)
+
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ValidationResult:
-    """Result of Kong validation"""
+    """Result of Kong validation (immutable - issues are stored as a tuple)"""
     valid: bool
     quality_score: float
-    issues: List[str]
+    issues: Tuple[str, ...]
     should_retry: bool
     reasoning: Optional[str] = None
     
+    def __post_init__(self):
+        # Frozen - bypass __setattr__ so a list passed in can't be mutated later
+        object.__setattr__(self, 'issues', tuple(self.issues))
+
 
 class BaseValidator(ABC):
     """Base class for validators"""
@@ -46,17 +137,43 @@ class OllamaValidator(BaseValidator):
         base_url: str = "http://localhost:11434",
         validation_prompt: Optional[str] = None,
         temperature: float = 0.1,
-        timeout: int = 30
+        timeout: int = 30,
+        max_cache: int = 128
     ):
         self.model = model
         self.base_url = base_url
         self.temperature = temperature
         self.timeout = timeout
         
+        # Recent LLM verdicts (LRU) - retries and reruns of unchanged data skip the round trip
+        self.max_cache = max_cache
+        self._cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         self.validation_prompt = validation_prompt or self._default_prompt()
+        self._prompt_source = None  # Template _prompt_parts was compiled from
+        self._entity_segments = self._cached_entity_segments()
         
         # Lazy import - only when actually used
         self._client = None
+        self._client_lock = threading.Lock()
+        
+        # Set once test_connection has found the model - later calls skip the round trip
+        self._connection_ok = False
+    
+    def __getstate__(self):
+        # Shipped to worker processes - locks and sockets don't pickle, reconnect lazily there
+        state = self.__dict__.copy()
+        state['_client'] = None
+        state['_cache'] = OrderedDict()
+        del state['_client_lock'], state['_cache_lock'], state['_entity_segments']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._client_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._entity_segments = self._cached_entity_segments()
     
     def _default_prompt(self) -> str:
         return """You are a data quality validator. Evaluate the following collected data for completeness and accuracy.
@@ -78,22 +195,28 @@ Be strict but fair. Data is valid if it contains meaningful content for the enti
     
     @property
     def client(self):
-        """Lazy-load the Ollama client"""
+        """Lazy-load the Ollama client (shared by batch_validate threads)"""
         if self._client is None:
-            try:
-                import ollama
-                self._client = ollama.Client(host=self.base_url)
-            except ImportError:
-                raise ImportError(
-                    "Ollama package not installed. "
-                    "Install with: pip install ollama"
-                )
+            with self._client_lock:
+                if self._client is None:
+                    try:
+                        import ollama
+                        self._client = ollama.Client(host=self.base_url)
+                    except ImportError:
+                        raise ImportError(
+                            "Ollama package not installed. "
+                            "Install with: pip install ollama"
+                        )
         return self._client
     
     def validate(self, entity: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate collected data using local LLM.
         
+        Verdicts are cached by (entity, data) content and by the model,
+        temperature and prompt they were produced with; fallback results
+        are not, so a recovered server gets asked again.
+        
         Args:
             entity: The entity identifier
             data: The collected data to validate
@@ -102,40 +225,25 @@ Be strict but fair. Data is valid if it contains meaningful content for the enti
             Dictionary with validation results
         """
         try:
-            # Format the prompt
-            prompt = self.validation_prompt.format(
-                entity=entity,
-                data=json.dumps(data, indent=2, default=str)[:2000]  # Truncate large data
-            )
-            
-            # Call Ollama
-            response = self.client.chat(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                options={"temperature": self.temperature}
-            )
-            
-            # Parse response
-            content = response['message']['content']
-            
-            # Extract JSON from response (handle markdown code blocks)
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-            
-            result = json.loads(content.strip())
-            
-            return {
-                'valid': result.get('valid', False),
-                'quality_score': float(result.get('quality_score', 0)),
-                'issues': result.get('issues', []),
-                'should_retry': result.get('should_retry', False),
-                'reasoning': result.get('reasoning', ''),
-                'model': self.model
-            }
+            # Serialized once, indented as the prompt shows it - the same bytes
+            # key the cache and fill the prompt
+            payload = serialization.dumps(data, indent=True)
+        except (TypeError, ValueError) as e:  # e.g. non-string keys, circular references
+            logger.error(f"Kong validation error: {e}")
+            return self._fallback_validation(entity, data)
+        
+        key = self._cache_key(entity, payload) if self.max_cache > 0 else None
+        if key is not None:
+            with self._cache_lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    return copy.deepcopy(cached)
+        
+        try:
+            result = self._ask_llm(entity, payload)
             
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson's decode error subclasses it
             logger.warning(f"Failed to parse LLM response: {e}")
             # Fallback to simple validation
             return self._fallback_validation(entity, data)
@@ -143,6 +251,114 @@ Be strict but fair. Data is valid if it contains meaningful content for the enti
         except Exception as e:
             logger.error(f"Kong validation error: {e}")
             return self._fallback_validation(entity, data)
+        
+        if key is not None:
+            with self._cache_lock:
+                # Cached copy is private - callers may mutate what they get back
+                self._cache[key] = copy.deepcopy(result)
+                while len(self._cache) > self.max_cache:
+                    self._cache.popitem(last=False)  # Evict least recently used
+        return result
+    
+    def _cache_key(self, entity: str, payload: bytes) -> str:
+        """Content hash of a validate() call's inputs (payload: the serialized data) and LLM settings"""
+        # The JSON array is self-delimiting - no separator needed before the payload
+        settings = [self.model, self.temperature, self.validation_prompt, entity]
+        digest = hashlib.blake2b(serialization.dumps(settings), digest_size=16)
+        digest.update(payload)
+        return digest.hexdigest()
+    
+    def _ask_llm(self, entity: str, payload: bytes) -> Dict[str, Any]:
+        """Query the model for a verdict on the serialized data - raises if the call or its reply fails"""
+        prompt = self._build_prompt(
+            entity=entity,
+            # Truncate large data to PROMPT_DATA_CHARS characters - no UTF-8
+            # character is over 4 bytes, so only that much is decoded
+            data=payload[:4 * PROMPT_DATA_CHARS].decode('utf-8', 'ignore')[:PROMPT_DATA_CHARS]
+        )
+        
+        # Call Ollama - streamed, so generation stops once the verdict object is complete
+        stream = self.client.chat(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            options={"temperature": self.temperature},
+            stream=True
+        )
+        
+        chunks = []
+        scanner = _JsonObjectScanner()
+        result = None
+        try:
+            for chunk in stream:
+                piece = chunk['message']['content']
+                chunks.append(piece)
+                for start, end in scanner.feed(piece):
+                    try:
+                        result = serialization.loads(''.join(chunks)[start:end])
+                        break
+                    except ValueError:
+                        continue  # Braces in prose - keep looking
+                if result is not None:
+                    break
+        finally:
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                close()  # Drops the connection, cancelling any trailing chatter
+        
+        if result is None:
+            # No parseable object on the fly - parse the whole reply as before
+            content = ''.join(chunks)
+            
+            # Extract JSON from response (handle markdown code blocks)
+            _, fence, body = content.partition("```json")
+            if not fence:
+                _, fence, body = content.partition("```")
+            if fence:
+                content = body.partition("```")[0]
+            
+            result = serialization.loads(content.strip())
+        
+        return {
+            'valid': result.get('valid', False),
+            'quality_score': float(result.get('quality_score', 0)),
+            'issues': result.get('issues', []),
+            'should_retry': result.get('should_retry', False),
+            'reasoning': result.get('reasoning', ''),
+            'model': self.model
+        }
+    
+    def _build_prompt(self, entity: str, data: str) -> str:
+        """Fill the validation prompt - the template is parsed once, not per call"""
+        if self._prompt_source is not self.validation_prompt:
+            # First call, or the prompt was replaced after construction
+            self._prompt_parts, self._prompt_slots = _compile_prompt(self.validation_prompt)
+            self._prompt_source = self.validation_prompt
+            self._entity_segments.cache_clear()
+        
+        # Entity already filled in (cached per entity) - only the data varies per call
+        return data.join(self._entity_segments(entity))
+    
+    def _cached_entity_segments(self):
+        """Per-instance LRU over _split_for_entity - repeat entities skip the substitution"""
+        return functools.lru_cache(maxsize=1024)(self._split_for_entity)
+    
+    def _split_for_entity(self, entity: str) -> Tuple[str, ...]:
+        """Prompt text between its {data} slots, with {entity} filled in"""
+        parts = self._prompt_parts.copy()
+        data_slots = []
+        for i, name in self._prompt_slots:
+            if name == 'entity':
+                parts[i] = entity
+            else:
+                data_slots.append(i)
+        
+        segments = []
+        start = 0
+        for i in data_slots:
+            segments.append(''.join(parts[start:i]))
+            start = i + 1
+        segments.append(''.join(parts[start:]))
+        return tuple(segments)
     
     def _fallback_validation(self, entity: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Fallback validation when LLM fails"""
@@ -160,43 +376,66 @@ Be strict but fair. Data is valid if it contains meaningful content for the enti
     def batch_validate(
         self, 
         items: List[tuple], 
-        concurrency: int = 1
+        concurrency: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Validate multiple items.
         
+        Each validation is a blocking round trip to Ollama, so with
+        concurrency > 1 they run on a thread pool.
+        
         Args:
             items: List of (entity, data) tuples
-            concurrency: Number of concurrent validations (future use)
+            concurrency: Number of concurrent validations (default: the
+                server's OLLAMA_NUM_PARALLEL setting, else 1)
             
         Returns:
-            List of validation results
+            List of validation results, in input order
         """
-        results = []
-        for entity, data in items:
-            result = self.validate(entity, data)
-            results.append(result)
-        return results
+        if not items:
+            return []
+        
+        if concurrency is None:
+            concurrency = int(os.environ.get('OLLAMA_NUM_PARALLEL', 1))
+        
+        if concurrency <= 1 or len(items) <= 1:
+            return [self.validate(entity, data) for entity, data in items]
+        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+            return list(executor.map(lambda item: self.validate(*item), items))
     
     def test_connection(self) -> bool:
-        """Test if Ollama is available"""
+        """
+        Test if Ollama is available.
+        
+        Only success is remembered - a missing model or connection error
+        is checked again next call, so a mid-run `ollama pull` is noticed.
+        Call invalidate_connection_cache() after switching models.
+        """
+        if self._connection_ok:
+            return True
+        
         try:
             models = self.client.list()
-            available = [m['name'] for m in models.get('models', [])]
+            available = {m['name'] for m in models.get('models', [])}
             
-            if self.model not in available and f"{self.model}:latest" not in available:
+            self._connection_ok = self.model in available or f"{self.model}:latest" in available
+            if not self._connection_ok:
                 logger.warning(
                     f"Model {self.model} not found. "
-                    f"Available: {available}. "
+                    f"Available: {sorted(available)}. "
                     f"Pull with: ollama pull {self.model}"
                 )
-                return False
             
-            return True
+            return self._connection_ok
             
         except Exception as e:
             logger.error(f"Ollama connection failed: {e}")
             return False
+    
+    def invalidate_connection_cache(self):
+        """Forget the remembered test_connection success (e.g. after a model swap)"""
+        self._connection_ok = False
 
 
 class SchemaValidator(BaseValidator):
@@ -211,8 +450,6 @@ class SchemaValidator(BaseValidator):
     
     def validate(self, entity: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate based on schema rules"""
-        issues = []
-        
         # Check for error
         if data.get('error'):
             return {
@@ -222,15 +459,16 @@ class SchemaValidator(BaseValidator):
                 'should_retry': True
             }
         
-        # Check required fields
-        for field in self.required_fields:
-            if field not in data or not data[field]:
-                issues.append(f"Missing required field: {field}")
+        # Check required fields - missing and empty alike, one lookup each, in schema order
+        get = data.get
+        issues = [
+            f"Missing required field: {field}" for field in self.required_fields if not get(field)
+        ]
         
         # Check data size
-        data_str = json.dumps(data)
-        if len(data_str) < self.min_data_size:
-            issues.append(f"Data too small: {len(data_str)} bytes")
+        size = _json_size_below(data, self.min_data_size)
+        if size is not None:
+            issues.append(f"Data too small: {size} bytes")
         
         # Calculate score
         if not issues:
@@ -242,7 +480,7 @@ class SchemaValidator(BaseValidator):
             'valid': len(issues) == 0,
             'quality_score': quality_score,
             'issues': issues,
-            'should_retry': len(issues) > 0 and 'Collection error' in str(issues)
+            'should_retry': len(issues) > 0 and 'Collection error' in '\n'.join(issues)
         }
 
 
@@ -252,26 +490,40 @@ class CompositeValidator(BaseValidator):
     Useful for schema check + LLM validation.
     """
     
-    def __init__(self, validators: List[BaseValidator]):
-        self.validators = validators
+    def __init__(self, validators: List[BaseValidator], short_circuit: bool = True):
+        # Cheap rule-based checks first, LLM round trips last (stable - order kept otherwise)
+        self.validators = sorted(validators, key=lambda v: isinstance(v, OllamaValidator))
+        self.short_circuit = short_circuit
     
     def validate(self, entity: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Run all validators and combine results"""
-        all_issues = []
-        min_score = 100.0
-        any_retry = False
+        """
+        Run validators and combine results.
         
+        With short_circuit, stops at the first result that is a hard
+        failure (zero score, retry requested) - later, costlier validators
+        could not rescue it.
+        """
+        # Aggregate in the same pass - issue lists are only chained together at the end
+        issue_lists = []
+        quality_score = 100.0
+        should_retry = False
         for validator in self.validators:
             result = validator.validate(entity, data)
-            all_issues.extend(result.get('issues', []))
-            min_score = min(min_score, result.get('quality_score', 0))
-            any_retry = any_retry or result.get('should_retry', False)
+            issue_lists.append(result.get('issues', ()))
+            score = result.get('quality_score', 0)
+            quality_score = min(quality_score, score)
+            retry = result.get('should_retry', False)
+            should_retry = should_retry or bool(retry)
+            if self.short_circuit and retry and score == 0:
+                break
+        
+        all_issues = list(chain.from_iterable(issue_lists))
         
         return {
             'valid': len(all_issues) == 0,
-            'quality_score': min_score,
+            'quality_score': quality_score,
             'issues': all_issues,
-            'should_retry': any_retry
+            'should_retry': should_retry
         }
 
 
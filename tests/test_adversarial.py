@@ -7,6 +7,7 @@ Run with: pytest tests/ -v
 import pytest
 from dataclasses import asdict
 from donkeykong.kong.adversarial import (
+    Action,
     AdversarialValidator,
     ValidationResult,
     OllamaAdversarialValidator
@@ -108,6 +109,7 @@ class TestAdversarialValidator:
         assert result.overall_confidence >= 0.7
         assert result.should_rerun is False
         assert "APPROVED" in str(result.recommended_actions)
+        assert result.actions == Action.APPROVED
     
     def test_validate_poor_analysis(self, validator, poor_analysis, poor_raw_data):
         """Poor analysis with poor data should fail"""
@@ -250,6 +252,44 @@ class TestBatchValidation:
         
         assert result['passed'] == 3
         assert result['needs_rerun'] == 0
+    
+    def test_duplicate_analyses_use_cache(self, validator):
+        """Identical analyses should be validated once and share a result"""
+        analysis = {"score": 7, "confidence": 0.8, "findings": ["a", "b", "c"]}
+        data = {"data_quality_score": 90}
+        
+        first = validator.validate("A", analysis, data)
+        assert validator.validate("B", dict(analysis), dict(data)) is first
+        assert validator.validate("C", analysis, data, use_cache=False) is not first
+        assert validator.validate("D", analysis, data, use_cache=False) == first
+    
+    def test_cached_result_is_immutable(self, validator):
+        """Shared cached results should not be corruptible through their lists"""
+        analysis = {"score": 9, "confidence": 0.9}
+        data = {"data_quality_score": 30}
+        
+        first = validator.validate("A", analysis, data)
+        assert first.issues_found
+        with pytest.raises(AttributeError):
+            first.issues_found.append("MUT")
+        
+        assert "MUT" not in validator.validate("B", analysis, data).issues_found
+        assert isinstance(first.recommended_actions, tuple)
+    
+    def test_cache_evicts_least_recently_used(self):
+        """Cache should stay within max_cache entries, dropping the least recently used"""
+        validator = AdversarialValidator(max_cache=2)
+        analyses = [{"score": i, "findings": []} for i in range(3)]
+        
+        first = validator.validate("0", analyses[0], {})
+        second = validator.validate("1", analyses[1], {})
+        assert validator.validate("0", analyses[0], {}) is first  # 0 now most recent
+        third = validator.validate("2", analyses[2], {})  # Evicts 1
+        
+        assert len(validator._cache) == 2
+        assert validator.validate("0", analyses[0], {}) is first
+        assert validator.validate("2", analyses[2], {}) is third
+        assert validator.validate("1", analyses[1], {}) is not second
 
 
 class TestCompletenessCheck:
@@ -369,6 +409,25 @@ class TestOllamaValidator:
             assert validator.completeness_weight == 0.4  # Default
         except ImportError:
             pytest.skip("Ollama not installed")
+    
+    def test_ollama_validator_does_not_replay_outages(self):
+        """LLM questions (and their fallback on failure) should be re-asked, not memoized"""
+        class DownClient:
+            calls = 0
+            
+            def chat(self, **kwargs):
+                DownClient.calls += 1
+                raise ConnectionError("ollama down")
+        
+        validator = OllamaAdversarialValidator(model="test")
+        validator._client = DownClient()
+        analysis = {"score": 7, "confidence": 0.8}
+        
+        validator.validate("TEST", analysis, {})
+        validator.validate("TEST", analysis, {})
+        
+        assert DownClient.calls == 2
+        assert len(validator._cache) == 0
 
 
 class TestEdgeCases:
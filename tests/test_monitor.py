@@ -0,0 +1,73 @@
+"""
+Tests for DonkeyKong failure tracking and the progress monitor
+
+Run with: pytest tests/ -v
+"""
+
+import argparse
+
+import pytest
+import redis
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from donkeykong.core.monitor import DonkeyMonitor, MonitorConfig
+from donkeykong.core.worker import FAILURES_RECENT_KEY, DonkeyWorker, WorkerConfig
+from donkeykong.interfaces.cli.main import cmd_retry
+
+
+class EchoWorker(DonkeyWorker):
+    def collect(self, entity):
+        return {'entity': entity}
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def worker(tmp_path, server):
+    config = WorkerConfig(
+        data_dir=str(tmp_path / 'data'),
+        backup_dir=str(tmp_path / 'backups'),
+        log_dir=str(tmp_path / 'logs')
+    )
+    with EchoWorker(config) as worker:
+        worker.redis = server
+        yield worker
+
+
+@pytest.fixture
+def monitor(tmp_path, server):
+    monitor = DonkeyMonitor(MonitorConfig(report_dir=str(tmp_path / 'reports')))
+    monitor.redis = server
+    return monitor
+
+
+class TestFailures:
+    """Test the recent-failures index across retries"""
+    
+    def test_retry_clears_index(self, worker, monitor, server, monkeypatch):
+        for entity in ('a', 'b', 'c'):
+            worker._record_failure(entity, 'boom')
+        
+        monkeypatch.setattr(redis, 'from_url', lambda *args, **kwargs: server)
+        cmd_retry(argparse.Namespace(strategy='default'))
+        
+        assert server.lrange(FAILURES_RECENT_KEY, 0, -1) == []
+        assert sorted(server.lrange('job:retry', 0, -1)) == ['a', 'b', 'c']
+        
+        worker._record_failure('d', 'boom again')
+        assert [f['entity'] for f in monitor.get_failures(limit=5)] == ['d']
+    
+    def test_get_failures_reads_past_stale_entries(self, worker, monitor, server):
+        for entity in ('old1', 'old2', 'old3'):
+            worker._record_failure(entity, 'boom')
+        # Index entries whose records were cleared without updating the index
+        server.lpush(FAILURES_RECENT_KEY, 'gone1', 'gone2', 'gone3')
+        
+        failures = monitor.get_failures(limit=2)
+        
+        assert [f['entity'] for f in failures] == ['old3', 'old2']
+        assert failures[0]['error'] == 'boom'
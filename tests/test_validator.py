@@ -0,0 +1,265 @@
+"""
+Tests for DonkeyKong Kong validators
+
+Run with: pytest tests/ -v
+"""
+
+import pytest
+from donkeykong.kong.validator import (
+    CompositeValidator,
+    OllamaValidator,
+    PROMPT_DATA_CHARS,
+    SchemaValidator,
+    ValidationResult,
+    _JsonObjectScanner
+)
+
+
+VERDICT = '{"valid": true, "quality_score": 90, "issues": ["minor"], "should_retry": false}'
+
+
+class FakeStream:
+    """Streamed chat reply, delivered in the given chunks"""
+    
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+    
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield {"message": {"content": chunk}}
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    """Ollama client double - replies with `reply` chunks, or raises `error`"""
+    
+    def __init__(self, reply=(VERDICT,), error=None):
+        self.reply = list(reply)
+        self.error = error
+        self.calls = []
+        self.streams = []
+    
+    def chat(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        stream = FakeStream(self.reply)
+        self.streams.append(stream)
+        return stream
+
+
+def ollama_validator(client, **kwargs):
+    validator = OllamaValidator(model="test", **kwargs)
+    validator._client = client
+    return validator
+
+
+def spans(scanner, *chunks):
+    text = ''.join(chunks)
+    return [text[start:end] for chunk in chunks for start, end in scanner.feed(chunk)]
+
+
+class TestValidationResult:
+    """Test ValidationResult dataclass"""
+    
+    def test_issues_are_immutable(self):
+        issues = ["Missing field"]
+        result = ValidationResult(valid=False, quality_score=50.0, issues=issues, should_retry=True)
+        
+        issues.append("Added later")
+        assert result.issues == ("Missing field",)
+        with pytest.raises(AttributeError):
+            result.issues.append("MUT")
+
+
+class TestOllamaConnection:
+    """Test OllamaValidator.test_connection (fake client)"""
+    
+    def test_only_success_is_remembered(self):
+        class FakeClient:
+            calls = 0
+            models = []
+            
+            def list(self):
+                FakeClient.calls += 1
+                return {"models": [{"name": name} for name in FakeClient.models]}
+        
+        validator = OllamaValidator(model="llama3.2")
+        validator._client = FakeClient()
+        
+        assert validator.test_connection() is False
+        FakeClient.models = ["llama3.2:latest"]  # ollama pull mid-run
+        assert validator.test_connection() is True
+        assert validator.test_connection() is True
+        assert FakeClient.calls == 2
+
+
+
+class TestJsonObjectScanner:
+    """Test spotting complete objects in streamed text"""
+    
+    def test_object_split_across_chunks(self):
+        assert spans(_JsonObjectScanner(), '{"valid": ', 'true}') == ['{"valid": true}']
+    
+    def test_braces_inside_strings_ignored(self):
+        text = '{"reasoning": "a } b {", "valid": true}'
+        assert spans(_JsonObjectScanner(), text[:20], text[20:]) == [text]
+    
+    def test_escaped_quotes_inside_strings(self):
+        text = '{"reasoning": "say \\"}\\" twice"}'
+        assert spans(_JsonObjectScanner(), text) == [text]
+    
+    def test_braces_in_prose_yield_their_own_span(self):
+        found = spans(_JsonObjectScanner(), 'Sure {not json}, "it\'s" fine: ', VERDICT)
+        assert found == ['{not json}', VERDICT]
+    
+    def test_code_fence(self):
+        assert spans(_JsonObjectScanner(), '```json\n', VERDICT, '\n```') == [VERDICT]
+    
+    def test_no_object(self):
+        assert spans(_JsonObjectScanner(), 'no verdict here', ' } stray') == []
+
+
+class TestOllamaValidator:
+    """Test the LLM round trip, its cache and fallback (fake client)"""
+    
+    def test_stops_reading_at_first_complete_verdict(self):
+        client = FakeClient(reply=['Here: {"valid": true, ', '"quality_score": 70}', ' more', ' text'])
+        result = ollama_validator(client).validate("E", {"a": 1})
+        
+        assert result['valid'] is True
+        assert result['quality_score'] == 70.0
+        assert client.streams[0].consumed == 2
+        assert client.streams[0].closed
+    
+    def test_skips_prose_braces(self):
+        client = FakeClient(reply=['I think {maybe} ', VERDICT])
+        assert ollama_validator(client).validate("E", {"a": 1})['issues'] == ["minor"]
+    
+    def test_no_verdict_falls_back(self):
+        result = ollama_validator(FakeClient(reply=['no json at all'])).validate("E", {"a": 1})
+        assert result['model'] == 'fallback'
+    
+    def test_repeat_call_uses_cache(self):
+        client = FakeClient()
+        validator = ollama_validator(client)
+        
+        first = validator.validate("E", {"a": 1})
+        assert validator.validate("E", {"a": 1}) == first
+        assert len(client.calls) == 1
+        
+        validator.validate("E", {"a": 2})
+        validator.validate("F", {"a": 1})
+        assert len(client.calls) == 3
+    
+    def test_cached_verdict_not_mutated_by_caller(self):
+        validator = ollama_validator(FakeClient())
+        validator.validate("E", {"a": 1})['issues'].append("MUT")
+        assert validator.validate("E", {"a": 1})['issues'] == ["minor"]
+    
+    def test_settings_change_invalidates_cache(self):
+        client = FakeClient()
+        validator = ollama_validator(client)
+        validator.validate("E", {"a": 1})
+        
+        validator.validation_prompt = "STRICT {entity}: {data}"
+        validator.validate("E", {"a": 1})
+        validator.temperature = 0.5
+        validator.validate("E", {"a": 1})
+        
+        assert len(client.calls) == 3
+        assert client.calls[1]['messages'][0]['content'] == 'STRICT E: {\n  "a": 1\n}'
+    
+    def test_fallback_not_cached(self):
+        client = FakeClient(error=ConnectionError("ollama down"))
+        validator = ollama_validator(client)
+        
+        assert validator.validate("E", {"a": 1})['model'] == 'fallback'
+        client.error = None
+        assert validator.validate("E", {"a": 1})['model'] == 'test'
+        assert len(client.calls) == 2
+    
+    def test_prompt_shows_indented_data_cut_to_limit(self):
+        client = FakeClient()
+        validator = ollama_validator(client, validation_prompt="{data}")
+        
+        validator.validate("E", {"text": "é" * 5000})
+        
+        prompt = client.calls[0]['messages'][0]['content']
+        assert prompt.startswith('{\n  "text": "éé')
+        assert len(prompt) == PROMPT_DATA_CHARS
+    
+    def test_unserializable_data_falls_back(self):
+        client = FakeClient()
+        result = ollama_validator(client).validate("E", {("a", "b"): 1})
+        
+        assert result['model'] == 'fallback'
+        assert client.calls == []
+    
+    def test_cache_evicts_least_recently_used(self):
+        client = FakeClient()
+        validator = ollama_validator(client, max_cache=2)
+        for entity in ("A", "B", "A", "C"):  # A refreshed, so B is evicted
+            validator.validate(entity, {"a": 1})
+        assert len(client.calls) == 3
+        
+        validator.validate("A", {"a": 1})
+        validator.validate("C", {"a": 1})
+        assert len(client.calls) == 3
+        validator.validate("B", {"a": 1})
+        assert len(client.calls) == 4
+
+
+class TestCompositeValidator:
+    """Test ordering and short-circuiting of combined validators"""
+    
+    def test_llm_validators_run_last(self):
+        llm = OllamaValidator(model="test")
+        schema = SchemaValidator(required_fields=["a"])
+        other = SchemaValidator()
+        
+        assert CompositeValidator([llm, schema, other]).validators == [schema, other, llm]
+    
+    def test_hard_failure_short_circuits(self):
+        client = FakeClient()
+        composite = CompositeValidator([ollama_validator(client), SchemaValidator()])
+        
+        result = composite.validate("E", {"error": "timeout"})
+        
+        assert client.calls == []
+        assert result['quality_score'] == 0.0
+        assert result['should_retry'] is True
+        assert result['issues'] == ["Collection error: timeout"]
+    
+    def test_without_short_circuit_every_validator_runs(self):
+        client = FakeClient()
+        composite = CompositeValidator(
+            [ollama_validator(client), SchemaValidator()], short_circuit=False
+        )
+        
+        result = composite.validate("E", {"error": "timeout"})
+        
+        assert len(client.calls) == 1
+        assert result['issues'] == ["Collection error: timeout", "minor"]
+    
+    def test_aggregates_scores_and_issues(self):
+        composite = CompositeValidator([
+            SchemaValidator(required_fields=["a"]),
+            SchemaValidator(required_fields=["b"], min_data_size=0)
+        ])
+        
+        result = composite.validate("E", {"a": "long enough value"})
+        
+        assert result['valid'] is False
+        assert result['quality_score'] == 75
+        assert result['issues'] == ["Missing required field: b"]
+        assert result['should_retry'] is False
+    
+    def test_no_validators(self):
+        result = CompositeValidator([]).validate("E", {})
+        assert result == {'valid': True, 'quality_score': 100.0, 'issues': [], 'should_retry': False}
@@ -0,0 +1,148 @@
+"""
+Tests for DonkeyKong workers (no Redis server needed)
+
+Run with: pytest tests/ -v
+"""
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+import redis
+
+from donkeykong.core.worker import DonkeyWorker, WorkerConfig
+
+
+class RecordingPipeline:
+    """Redis pipeline double - records queued writes, optionally failing execute()"""
+    
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.commands = []
+    
+    def hset(self, key, mapping):
+        self.commands.append(('hset', key, mapping))
+    
+    def hincrby(self, key, field, amount):
+        self.commands.append(('hincrby', key, field, amount))
+    
+    def publish(self, channel, message):
+        pass
+    
+    def execute(self):
+        if self.fail:
+            raise redis.ConnectionError("redis down")
+        return []
+
+
+class EchoWorker(DonkeyWorker):
+    def collect(self, entity):
+        return {'entity': entity}
+
+
+@pytest.fixture
+def worker(tmp_path):
+    config = WorkerConfig(
+        data_dir=str(tmp_path / 'data'),
+        backup_dir=str(tmp_path / 'backups'),
+        log_dir=str(tmp_path / 'logs')
+    )
+    with EchoWorker(config) as worker:
+        yield worker
+
+
+class TestStatsPush:
+    """Test delta updates of the worker stats hash"""
+    
+    def push(self, worker, fail=False):
+        pipe = RecordingPipeline(fail)
+        worker._update_redis_stats(pipe)
+        try:
+            pipe.execute()
+        except redis.RedisError as e:
+            worker._stats_write_failed(e)
+        return [command[0] for command in pipe.commands], pipe.commands
+    
+    def test_first_push_seeds_then_sends_deltas(self, worker):
+        assert self.push(worker)[0] == ['hset']
+        
+        worker.stats['entities_processed'] += 2
+        kinds, commands = self.push(worker)
+        assert kinds == ['hincrby']
+        assert commands[0][2:] == ('entities_processed', 2)
+    
+    def test_failed_push_reseeds(self, worker):
+        self.push(worker)
+        worker.stats['entities_processed'] += 1
+        self.push(worker, fail=True)  # Delta lost
+        
+        worker.stats['entities_processed'] += 1
+        kinds, commands = self.push(worker)
+        assert kinds == ['hset']
+        assert commands[0][2]['entities_processed'] == '2'
+
+
+class TestResultWriter:
+    """Test the background result writer's lifecycle"""
+    
+    def test_close_writes_queued_results_and_stops_thread(self, worker):
+        worker.redis.pipeline = lambda **kwargs: RecordingPipeline()
+        for entity in ('a', 'b', 'c'):
+            worker.process_entity(entity)
+        writer = worker._writer
+        
+        worker.close()
+        
+        assert not writer.is_alive()
+        assert len(os.listdir(worker.config.data_dir)) == 3
+    
+    def test_idle_worker_starts_no_thread(self, worker):
+        assert worker._writer is None
+        worker.close()  # Nothing to stop
+
+
+def load_wikipedia_example():
+    """Import examples/wikipedia_quality/worker.py (not a package) as a module"""
+    path = Path(__file__).resolve().parent.parent / 'examples' / 'wikipedia_quality' / 'worker.py'
+    spec = importlib.util.spec_from_file_location('wikipedia_quality_worker', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestWikipediaExample:
+    """Test the example worker's entry point wiring"""
+    
+    def test_main_batches_from_environment(self, tmp_path, monkeypatch):
+        example = load_wikipedia_example()
+        articles = tmp_path / 'articles.txt'
+        articles.write_text('\n'.join(f'Article_{i}' for i in range(60)))
+        
+        for name, value in {
+            'ARTICLES_FILE': str(articles),
+            'START_INDEX': '0',
+            'END_INDEX': '60',
+            'BATCH_SIZE': '50',
+            'RATE_LIMIT': '0',
+            'REDIS_URL': 'redis://127.0.0.1:1',  # Nothing listens - stats writes just fail
+            'DATA_DIR': str(tmp_path / 'data'),
+            'BACKUP_DIR': str(tmp_path / 'backups'),
+            'LOG_DIR': str(tmp_path / 'logs'),
+            'WIKI_CACHE': '0'
+        }.items():
+            monkeypatch.setenv(name, value)
+        
+        batches = []
+        
+        def collect_batch(self, entities):
+            batches.append(list(entities))
+            return {entity: {'title': entity} for entity in entities}
+        
+        monkeypatch.setattr(example.WikipediaWorker, 'collect_batch', collect_batch)
+        monkeypatch.setattr(example.WikipediaWorker, 'validate',
+                            lambda self, entity, data: {'valid': True, 'issues': [], 'quality_score': 90.0})
+        
+        example.main()
+        
+        assert [len(batch) for batch in batches] == [50, 10]